@@ -1,24 +1,50 @@
+from emunium._browser.launcher import LAUNCH_PRESETS, LaunchOptions
+from emunium._browser.locator import LiveLocator
+from emunium._browser.pool import BrowserPool
+from emunium._browser.process import ProcessMonitor, ResourceSample
+from emunium._browser.profile import ProfileTemplate
+from emunium._browser.reaper import Reaper, get_reaper, set_reaper
+from emunium._input.backend import InputBackend
+from emunium._input.backend import set_backend as set_input_backend
 from emunium._standalone.config import ClickType
+from emunium._timing import TimingPolicy
+from emunium._timing import set_policy as set_timing_policy
 from emunium.bridge import Bridge
-from emunium.browser import Browser
+from emunium.browser import Browser, Page
 from emunium.chrome_installer import ensure_chrome
 from emunium.coords import CoordsStore, ElementRecord
 from emunium.element import Element
-from emunium.locator import Locator, PageParser
+from emunium.locator import Locator, PageParser, Schema
 from emunium.standalone import Emunium
 from emunium.wait import Wait, WaitStrategy
 
 __all__ = [
     "Browser",
+    "BrowserPool",
     "Bridge",
     "ClickType",
     "Element",
     "Emunium",
     "CoordsStore",
     "ElementRecord",
+    "InputBackend",
+    "LAUNCH_PRESETS",
+    "LaunchOptions",
+    "LiveLocator",
     "Locator",
+    "Page",
     "PageParser",
+    "ProcessMonitor",
+    "ProfileTemplate",
+    "Reaper",
+    "ResourceSample",
+    "Schema",
+    "TimingPolicy",
     "Wait",
     "WaitStrategy",
     "ensure_chrome",
+    "get_reaper",
+    "set_input_backend",
+    "set_reaper",
+    "set_timing_policy",
 ]
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from emunium._bridge.transport import Transport
+from emunium._bridge.transport import TabTransport, Transport
 
 
 class DomCommands:
-    def __init__(self, transport: Transport) -> None:
+    def __init__(self, transport: Transport | TabTransport) -> None:
         self._t = transport
 
     def query_selector(self, selector: str, timeout: float = 10.0) -> dict | None:
@@ -20,6 +20,21 @@ class DomCommands:
     def get_all_interactive(self, timeout: float = 10.0) -> list[dict]:
         return self._t._send_list("getAllInteractive", timeout=timeout)
 
+    def locator_all(
+        self, selector: str, filters: list[dict], timeout: float = 10.0
+    ) -> list[dict]:
+        return self._t._send_list(
+            "locatorAll", {"selector": selector, "filters": filters}, timeout=timeout
+        )
+
+    def locator_count(
+        self, selector: str, filters: list[dict], timeout: float = 10.0
+    ) -> int:
+        result = self._t._send_optional(
+            "locatorCount", {"selector": selector, "filters": filters}, timeout=timeout
+        )
+        return int(result.get("count", 0)) if result else 0
+
     def get_element_by_text(
         self, text: str, exact: bool = False, timeout: float = 10.0
     ) -> list[dict]:
@@ -35,6 +50,13 @@ class DomCommands:
             "getElementCoords", {"elementId": element_id}, timeout=timeout
         )
 
+    def relocate(
+        self, element_id: str, recipe: dict[str, str], timeout: float = 10.0
+    ) -> dict | None:
+        return self._t._send_optional(
+            "relocate", {"elementId": element_id, **recipe}, timeout=timeout
+        )
+
     def scroll_into_view(self, element_id: str, timeout: float = 10.0) -> dict:
         return self._t._send_with_retry(
             "scrollIntoView", {"elementId": element_id}, timeout=timeout
@@ -47,18 +69,30 @@ class DomCommands:
         timeout: float = 10.0,
         state: str | None = None,
         conditions: list[dict] | None = None,
+        filters: list[dict] | None = None,
     ) -> dict | None:
         params = {"selector": selector, "type": type, "timeout": int(timeout * 1000)}
         if state is not None:
             params["state"] = state
         if conditions is not None:
             params["conditions"] = conditions
+        if filters:
+            params["filters"] = filters
         return self._t._send_optional(
             "waitForSelector",
             params,
             timeout=timeout + 5,
         )
 
+    def wait_for_selectors(
+        self, selectors: list[str], timeout: float = 10.0
+    ) -> list[dict]:
+        return self._t._send_list(
+            "waitForAll",
+            {"selectors": selectors, "timeout": int(timeout * 1000)},
+            timeout=timeout + 5,
+        )
+
     def focus(self, element_id: str, timeout: float = 10.0) -> dict:
         return self._t._send_with_retry(
             "focus", {"elementId": element_id}, timeout=timeout
@@ -82,9 +116,28 @@ class DomCommands:
         )
         return result.get("value") if result else None
 
+    def read_elements(
+        self,
+        element_ids: list[str],
+        attrs: list[str],
+        styles: list[str],
+        props: list[str],
+        timeout: float = 10.0,
+    ) -> list[dict]:
+        return self._t._send_list(
+            "readElements",
+            {
+                "elementIds": element_ids,
+                "attrs": attrs,
+                "styles": styles,
+                "props": props,
+            },
+            timeout=timeout,
+        )
+
 
 class PageCommands:
-    def __init__(self, transport: Transport) -> None:
+    def __init__(self, transport: Transport | TabTransport) -> None:
         self._t = transport
 
     def navigate(self, url: str, timeout: float = 30.0) -> dict:
@@ -97,6 +150,9 @@ class PageCommands:
     def page_info(self, timeout: float = 10.0) -> dict:
         return self._t._send_with_retry("pageInfo", timeout=timeout)
 
+    def window_geometry(self, timeout: float = 10.0) -> dict | None:
+        return self._t._send_optional("windowGeometry", timeout=timeout)
+
     def scroll_to(self, x: int, y: int, timeout: float = 10.0) -> dict:
         return self._t._send_with_retry("scrollTo", {"x": x, "y": y}, timeout=timeout)
 
@@ -112,28 +168,45 @@ class PageCommands:
 
 
 class TabCommands:
-    def __init__(self, transport: Transport) -> None:
+    def __init__(self, transport: Transport | TabTransport) -> None:
         self._t = transport
 
     def get_tab_info(self, timeout: float = 10.0) -> dict:
         return self._t.send("getTabInfo", timeout=timeout)
 
-    def create_tab(self, url: str = "about:blank", timeout: float = 10.0) -> dict:
-        return self._t.send("createTab", {"url": url}, timeout=timeout)
+    def create_tab(
+        self, url: str = "about:blank", active: bool = True, timeout: float = 10.0
+    ) -> dict:
+        return self._t.send(
+            "createTab", {"url": url, "active": active}, timeout=timeout
+        )
+
+    def activate_tab(self, timeout: float = 10.0) -> dict:
+        return self._t.send("activateTab", timeout=timeout)
 
     def close_tab(self, tab_id: int | None = None, timeout: float = 10.0) -> dict:
         params = {"tabId": tab_id} if tab_id else {}
         return self._t.send("closeTab", params, timeout=timeout)
 
+    def reset_session(self, timeout: float = 30.0) -> dict:
+        return self._t.send("resetSession", timeout=timeout)
+
 
 class NetworkCommands:
-    def __init__(self, transport: Transport) -> None:
+    def __init__(self, transport: Transport | TabTransport) -> None:
         self._t = transport
 
-    def wait_for_response(self, pattern: str, timeout: float = 10.0) -> dict | None:
+    def wait_for_response(
+        self, pattern: str, timeout: float = 10.0, tab_id: int | None = None
+    ) -> dict | None:
         params = {"pattern": pattern, "timeout": int(timeout * 1000)}
+        if tab_id is not None:
+            params["tabId"] = tab_id
         return self._t._send_optional("waitForResponse", params, timeout=timeout + 5)
 
-    def get_recent_responses(self, timeout: float = 10.0) -> list[dict]:
-        result = self._t._send_with_retry("getRecentResponses", timeout=timeout)
+    def get_recent_responses(
+        self, timeout: float = 10.0, tab_id: int | None = None
+    ) -> list[dict]:
+        params = {"tabId": tab_id} if tab_id is not None else None
+        result = self._t._send_with_retry("getRecentResponses", params, timeout=timeout)
         return result.get("responses", []) if result else []
@@ -8,21 +8,73 @@ from emunium._bridge.commands import (
     PageCommands,
     TabCommands,
 )
-from emunium._bridge.transport import Transport
+from emunium._bridge.screen import ScreenMapper
+from emunium._bridge.transport import TabTransport, Transport
+
+
+def _newer(current: str | None, value: str | None) -> str | None:
+    if value is None:
+        return current
+    if current is None:
+        return value
+    token, _, count = current.rpartition(":")
+    value_token, _, value_count = value.rpartition(":")
+    if token != value_token:
+        return value
+    try:
+        return value if int(value_count) > int(count) else current
+    except ValueError:
+        return value
 
 
 class Bridge:
-    def __init__(self, host: str = "127.0.0.1", port: int = 0) -> None:
-        self._transport = Transport(host=host, port=port)
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        token: str | None = None,
+        transport: Transport | TabTransport | None = None,
+        screen: ScreenMapper | None = None,
+    ) -> None:
+        self._transport = transport or Transport(host=host, port=port, token=token)
+        self._tab_scoped = isinstance(self._transport, TabTransport)
         self._dom = DomCommands(self._transport)
         self._page = PageCommands(self._transport)
         self._tabs = TabCommands(self._transport)
         self._network = NetworkCommands(self._transport)
+        self._layout_epoch: str | None = None
+        self._dom_epoch: str | None = None
+        self._screen = screen or ScreenMapper()
+        self._transport.on("layoutChanged", self._on_layout_changed)
+        self._transport.on("tabReady", self._on_tab_ready)
+
+    def for_tab(self, tab_id: int) -> Bridge:
+        """Bridge on the same connection whose commands all target *tab_id*.
+
+        The view keeps its own layout epochs and shares the window geometry
+        cache. Call :meth:`detach` when done with it.
+        """
+        return Bridge(transport=self._transport.for_tab(tab_id), screen=self._screen)
+
+    def detach(self) -> None:
+        """Stop a tab view from receiving page events."""
+        self._transport.off("layoutChanged", self._on_layout_changed)
+        self._transport.off("tabReady", self._on_tab_ready)
 
     @property
     def actual_port(self) -> int | None:
         return self._transport.actual_port
 
+    @property
+    def token(self) -> str | None:
+        """Session token the extension must present, ``None`` to accept any."""
+        return self._transport.token
+
+    @token.setter
+    def token(self, value: str | None) -> None:
+        self._transport.token = value
+
     @property
     def pinned_tab_id(self) -> int | None:
         return self._transport._pinned_tab_id
@@ -31,12 +83,83 @@ class Bridge:
     def pinned_tab_id(self, value: int | None) -> None:
         self._transport._pinned_tab_id = value
 
+    @property
+    def layout_epoch(self) -> str | None:
+        """Latest layout epoch reported by the page, ``None`` when unknown."""
+        return self._layout_epoch
+
+    @layout_epoch.setter
+    def layout_epoch(self, value: str | None) -> None:
+        self._layout_epoch = value
+
+    @property
+    def dom_epoch(self) -> str | None:
+        """Latest DOM-structure epoch reported by the page, ``None`` when unknown."""
+        return self._dom_epoch
+
+    @dom_epoch.setter
+    def dom_epoch(self, value: str | None) -> None:
+        self._dom_epoch = value
+
+    def observe_epochs(self, layout: str | None = None, dom: str | None = None) -> None:
+        """Record epochs seen in a response, never moving back to older ones.
+
+        A ``layoutChanged`` event can overtake the response that was stamped
+        before the change, so an epoch only replaces one of the same document
+        when its counter is higher.
+        """
+        self._layout_epoch = _newer(self._layout_epoch, layout)
+        self._dom_epoch = _newer(self._dom_epoch, dom)
+
+    @property
+    def screen_mapper(self) -> ScreenMapper:
+        return self._screen
+
+    def update_geometry(self, geometry: dict[str, object]) -> None:
+        self._screen.update(geometry, self.pinned_tab_id)
+
+    def observe_geometry(self, data: dict[str, object]) -> None:
+        self._screen.observe(data, self.pinned_tab_id)
+
+    def _ensure_geometry(self) -> None:
+        if self._screen.get(self.pinned_tab_id) is None:
+            geometry = self._page.window_geometry()
+            if geometry:
+                self.update_geometry(geometry)
+
+    def to_screen(self, rect: dict[str, float]) -> tuple[float, float]:
+        self._ensure_geometry()
+        return self._screen.to_screen(rect, self.pinned_tab_id)
+
+    def to_screen_many(
+        self, rects: list[dict[str, float]]
+    ) -> list[tuple[float, float]]:
+        self._ensure_geometry()
+        return self._screen.to_screen_many(rects, self.pinned_tab_id)
+
+    def _from_pinned_tab(self, msg: dict) -> bool:
+        pinned = self.pinned_tab_id
+        return pinned is None or msg.get("tabId") == pinned
+
+    def _on_layout_changed(self, msg: dict) -> None:
+        if self._from_pinned_tab(msg):
+            self.observe_epochs(msg.get("epoch"), msg.get("domEpoch"))
+
+    def _on_tab_ready(self, msg: dict) -> None:
+        if msg.get("frameId") == 0 and self._from_pinned_tab(msg):
+            self._layout_epoch = None
+            self._dom_epoch = None
+
     def start(self, timeout: float = 30.0) -> None:
         self._transport.start(timeout=timeout)
 
     def on(self, event: str, handler: Callable) -> None:
         self._transport.on(event, handler)
 
+    @property
+    def connected(self) -> bool:
+        return self._transport.connected
+
     def wait_for_connection(self, timeout: float = 60.0) -> bool:
         return self._transport.wait_for_connection(timeout=timeout)
 
@@ -61,6 +184,16 @@ class Bridge:
     def get_all_interactive(self, timeout: float = 10.0) -> list[dict]:
         return self._dom.get_all_interactive(timeout)
 
+    def locator_all(
+        self, selector: str, filters: list[dict], timeout: float = 10.0
+    ) -> list[dict]:
+        return self._dom.locator_all(selector, filters, timeout)
+
+    def locator_count(
+        self, selector: str, filters: list[dict], timeout: float = 10.0
+    ) -> int:
+        return self._dom.locator_count(selector, filters, timeout)
+
     def get_element_by_text(
         self, text: str, exact: bool = False, timeout: float = 10.0
     ) -> list[dict]:
@@ -70,7 +203,17 @@ class Bridge:
         return self._dom.query_xpath(xpath, timeout)
 
     def get_element_coords(self, element_id: str, timeout: float = 10.0) -> dict | None:
-        return self._dom.get_element_coords(element_id, timeout)
+        result = self._dom.get_element_coords(element_id, timeout)
+        if isinstance(result, dict) and isinstance(result.get("rect"), dict):
+            self.observe_geometry(result)
+            point = self.to_screen(result["rect"])
+            result["absoluteScreenX"], result["absoluteScreenY"] = point
+        return result
+
+    def relocate(
+        self, element_id: str, recipe: dict[str, str], timeout: float = 10.0
+    ) -> dict | None:
+        return self._dom.relocate(element_id, recipe, timeout)
 
     def scroll_into_view(self, element_id: str, timeout: float = 10.0) -> dict:
         return self._dom.scroll_into_view(element_id, timeout)
@@ -82,11 +225,22 @@ class Bridge:
         timeout: float = 10.0,
         state: str | None = None,
         conditions: list[dict] | None = None,
+        filters: list[dict] | None = None,
     ) -> dict | None:
         return self._dom.wait_for_selector(
-            selector, type, timeout, state=state, conditions=conditions
+            selector,
+            type,
+            timeout,
+            state=state,
+            conditions=conditions,
+            filters=filters,
         )
 
+    def wait_for_selectors(
+        self, selectors: list[str], timeout: float = 10.0
+    ) -> list[dict]:
+        return self._dom.wait_for_selectors(selectors, timeout)
+
     def focus(self, element_id: str, timeout: float = 10.0) -> dict:
         return self._dom.focus(element_id, timeout)
 
@@ -100,12 +254,25 @@ class Bridge:
     ) -> str | None:
         return self._dom.get_computed_style(element_id, prop, timeout)
 
+    def read_elements(
+        self,
+        element_ids: list[str],
+        attrs: list[str],
+        styles: list[str],
+        props: list[str],
+        timeout: float = 10.0,
+    ) -> list[dict]:
+        return self._dom.read_elements(element_ids, attrs, styles, props, timeout)
+
     def navigate(self, url: str, timeout: float = 30.0) -> dict:
         return self._page.navigate(url, timeout)
 
     def page_info(self, timeout: float = 10.0) -> dict:
         return self._page.page_info(timeout)
 
+    def window_geometry(self, timeout: float = 10.0) -> dict | None:
+        return self._page.window_geometry(timeout)
+
     def scroll_to(self, x: int, y: int, timeout: float = 10.0) -> dict:
         return self._page.scroll_to(x, y, timeout)
 
@@ -118,14 +285,32 @@ class Bridge:
     def get_tab_info(self, timeout: float = 10.0) -> dict:
         return self._tabs.get_tab_info(timeout)
 
-    def create_tab(self, url: str = "about:blank", timeout: float = 10.0) -> dict:
-        return self._tabs.create_tab(url, timeout)
+    def create_tab(
+        self, url: str = "about:blank", active: bool = True, timeout: float = 10.0
+    ) -> dict:
+        return self._tabs.create_tab(url, active, timeout)
+
+    def activate_tab(self, timeout: float = 10.0) -> dict:
+        return self._tabs.activate_tab(timeout)
 
     def close_tab(self, tab_id: int | None = None, timeout: float = 10.0) -> dict:
         return self._tabs.close_tab(tab_id, timeout)
 
+    def reset_session(self, timeout: float = 30.0) -> dict:
+        """Leave one blank tab and clear cookies, storage and caches."""
+        result = self._tabs.reset_session(timeout)
+        if result and not result.get("error"):
+            self._screen.invalidate(self.pinned_tab_id)
+            self.pinned_tab_id = result.get("tabId")
+            self._layout_epoch = None
+            self._dom_epoch = None
+        return result
+
     def wait_for_response(self, pattern: str, timeout: float = 10.0) -> dict | None:
-        return self._network.wait_for_response(pattern, timeout)
+        return self._network.wait_for_response(pattern, timeout, self._scope_id())
 
     def get_recent_responses(self, timeout: float = 10.0) -> list[dict]:
-        return self._network.get_recent_responses(timeout)
+        return self._network.get_recent_responses(timeout, self._scope_id())
+
+    def _scope_id(self) -> int | None:
+        return self.pinned_tab_id if self._tab_scoped else None
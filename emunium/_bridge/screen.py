@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from typing import Dict
+
+Geometry = Dict[str, float]
+
+_GEOMETRY_KEYS = ("screenX", "screenY", "left", "top")
+
+
+class ScreenMapper:
+    """Client-rect to screen-point conversion from cached window geometry.
+
+    The page reports its window geometry (``screenX``/``screenY`` and the
+    browser chrome borders) only when it changes, so element payloads carry
+    just client rects and the arithmetic happens here, per tab. Every payload
+    does carry the geometry version; when it differs from the cached one an
+    update was missed (say, in a timed-out response) and the cache is dropped.
+    """
+
+    def __init__(self) -> None:
+        self._geometry: dict[int | None, Geometry] = {}
+        self._versions: dict[int | None, str | None] = {}
+
+    def update(
+        self,
+        geometry: dict[str, object],
+        tab_id: int | None = None,
+        version: str | None = None,
+    ) -> None:
+        self._geometry[tab_id] = {
+            key: float(geometry.get(key, 0) or 0) for key in _GEOMETRY_KEYS
+        }
+        self._versions[tab_id] = version or geometry.get("version")
+
+    def observe(self, data: dict[str, object], tab_id: int | None = None) -> None:
+        """Take the geometry from a stamped payload, or notice a missed one."""
+        version = data.get("geometryVersion")
+        if data.get("geometry"):
+            self.update(data["geometry"], tab_id, version)
+        elif version is not None and version != self._versions.get(tab_id):
+            self.invalidate(tab_id)
+
+    def get(self, tab_id: int | None = None) -> Geometry | None:
+        return self._geometry.get(tab_id)
+
+    def invalidate(self, tab_id: int | None = None) -> None:
+        self._geometry.pop(tab_id, None)
+        self._versions.pop(tab_id, None)
+
+    def origin(self, tab_id: int | None = None) -> tuple[float, float]:
+        geometry = self._geometry.get(tab_id)
+        if geometry is None:
+            return 0.0, 0.0
+        return (
+            geometry["screenX"] + geometry["left"],
+            geometry["screenY"] + geometry["top"],
+        )
+
+    def to_screen(
+        self, rect: dict[str, float], tab_id: int | None = None
+    ) -> tuple[float, float]:
+        """Screen coordinates of the centre of a client *rect*."""
+        ox, oy = self.origin(tab_id)
+        return (
+            ox + rect.get("x", 0) + rect.get("width", 0) / 2,
+            oy + rect.get("y", 0) + rect.get("height", 0) / 2,
+        )
+
+    def to_screen_many(
+        self, rects: list[dict[str, float]], tab_id: int | None = None
+    ) -> list[tuple[float, float]]:
+        """Batch :meth:`to_screen` with a single geometry lookup."""
+        ox, oy = self.origin(tab_id)
+        return [
+            (
+                ox + r.get("x", 0) + r.get("width", 0) / 2,
+                oy + r.get("y", 0) + r.get("height", 0) / 2,
+            )
+            for r in rects
+        ]
@@ -12,21 +12,60 @@ import websockets.server
 
 logger = logging.getLogger("emunium.bridge")
 
+# Safe to run twice: replayed under their original id after the extension's
+# service worker reconnects. Anything else already sent when the socket
+# drops fails immediately with ConnectionError.
+IDEMPOTENT_METHODS = frozenset(
+    {
+        "activateTab",
+        "focus",
+        "getAllInteractive",
+        "getAttribute",
+        "getComputedStyle",
+        "getElementCoords",
+        "getRecentResponses",
+        "getTabInfo",
+        "locatorAll",
+        "locatorCount",
+        "pageInfo",
+        "ping",
+        "queryByText",
+        "querySelector",
+        "querySelectorAll",
+        "queryXPath",
+        "readElements",
+        "relocate",
+        "scrollIntoView",
+        "scrollTo",
+        "waitForAll",
+        "waitForResponse",
+        "waitForSelector",
+        "windowGeometry",
+    }
+)
+
 
 class Transport:
-    def __init__(self, host: str = "127.0.0.1", port: int = 0) -> None:
+    def __init__(
+        self, host: str = "127.0.0.1", port: int = 0, token: str | None = None
+    ) -> None:
         self.host = host
         self.port = port
+        self.token = token
         self._server: websockets.server.WebSocketServer | None = None
         self._loop: asyncio.AbstractEventLoop | None = None
         self._thread: threading.Thread | None = None
         self._ws: websockets.server.WebSocketServerProtocol | None = None
         self._pending: dict[int, asyncio.Future] = {}
+        # id -> [method, serialized message, sent on the current socket]
+        self._outbox: dict[int, list] = {}
+        self._ever_connected = False
         self._next_id = 1
         self._id_lock = threading.Lock()
         self._connected = threading.Event()
         self._event_handlers: dict[str, list[Callable]] = {}
         self._ready_event = threading.Event()
+        self._start_error: BaseException | None = None
         self._pinned_tab_id: int | None = None
 
     @property
@@ -43,11 +82,17 @@ class Transport:
         )
         self._thread.start()
         self._ready_event.wait(timeout=timeout)
+        if self._start_error is not None:
+            raise self._start_error
         logger.info("Bridge listening on %s:%d", self.host, self.actual_port)
 
     def _run_loop(self) -> None:
         asyncio.set_event_loop(self._loop)
-        self._loop.run_until_complete(self._serve())
+        try:
+            self._loop.run_until_complete(self._serve())
+        except OSError as e:
+            self._start_error = e
+            self._ready_event.set()
 
     async def _serve(self) -> None:
         self._server = await websockets.serve(
@@ -60,9 +105,19 @@ class Transport:
     async def _handle_connection(
         self, ws: websockets.server.WebSocketServerProtocol
     ) -> None:
+        if self.token is not None and not await self._authenticate(ws):
+            logger.warning("Rejected extension connection: wrong session token")
+            await ws.close()
+            return
         logger.info("Extension connected")
+        if self._ws is not None:
+            self._drop_in_flight()
         self._ws = ws
+        self._ever_connected = True
         self._connected.set()
+        # Tells the extension the hello was accepted, so it resets its backoff.
+        self._loop.create_task(ws.send(json.dumps({"event": "welcome"})))
+        self._flush()
         try:
             async for raw in ws:
                 try:
@@ -76,6 +131,7 @@ class Transport:
 
                 msg_id = msg.get("id")
                 if msg_id is not None and msg_id in self._pending:
+                    self._outbox.pop(msg_id, None)
                     fut = self._pending.pop(msg_id)
                     if not fut.done():
                         self._loop.call_soon_threadsafe(
@@ -84,9 +140,57 @@ class Transport:
         except websockets.exceptions.ConnectionClosed:
             pass
         finally:
-            logger.info("Extension disconnected")
-            self._ws = None
-            self._connected.clear()
+            if self._ws is ws:
+                logger.info("Extension disconnected")
+                self._ws = None
+                self._connected.clear()
+                self._drop_in_flight()
+
+    async def _authenticate(
+        self, ws: websockets.server.WebSocketServerProtocol
+    ) -> bool:
+        """The extension's first message must be a hello with our token."""
+        try:
+            msg = json.loads(await asyncio.wait_for(ws.recv(), timeout=5))
+        except (asyncio.TimeoutError, json.JSONDecodeError):
+            return False
+        except websockets.exceptions.ConnectionClosed:
+            return False
+        if msg.get("event") != "hello" or msg.get("token") != self.token:
+            return False
+        self._dispatch_event(msg)
+        return True
+
+    def _drop_in_flight(self) -> None:
+        """Fail sent non-idempotent requests; queue the rest for replay."""
+        for msg_id, entry in list(self._outbox.items()):
+            method, _, sent = entry
+            if sent and method not in IDEMPOTENT_METHODS:
+                self._outbox.pop(msg_id, None)
+                fut = self._pending.pop(msg_id, None)
+                if fut is not None and not fut.done():
+                    fut.set_exception(
+                        ConnectionError(f"Extension disconnected during {method}")
+                    )
+            else:
+                entry[2] = False
+
+    def _flush(self, msg_id: int | None = None) -> None:
+        """Send queued requests (or just *msg_id*) on the current socket."""
+        ws = self._ws
+        if ws is None:
+            return
+        ids = list(self._outbox) if msg_id is None else [msg_id]
+        replayed = 0
+        for pending_id in ids:
+            entry = self._outbox.get(pending_id)
+            if entry is None or entry[2]:
+                continue
+            entry[2] = True
+            replayed += msg_id is None
+            self._loop.create_task(ws.send(entry[1]))
+        if replayed:
+            logger.info("Replayed %d pending request(s) after reconnect", replayed)
 
     def _dispatch_event(self, msg: dict) -> None:
         event_name = msg.get("event", "")
@@ -100,6 +204,18 @@ class Transport:
     def on(self, event: str, handler: Callable) -> None:
         self._event_handlers.setdefault(event, []).append(handler)
 
+    def off(self, event: str, handler: Callable) -> None:
+        handlers = self._event_handlers.get(event, [])
+        if handler in handlers:
+            handlers.remove(handler)
+
+    def for_tab(self, tab_id: int) -> TabTransport:
+        return TabTransport(self, tab_id)
+
+    @property
+    def connected(self) -> bool:
+        return self._connected.is_set()
+
     def wait_for_connection(self, timeout: float = 60.0) -> bool:
         return self._connected.wait(timeout=timeout)
 
@@ -110,7 +226,7 @@ class Transport:
         timeout: float = 30.0,
         tab_id: int | None = None,
     ) -> object:
-        if not self._connected.is_set():
+        if not self._ever_connected:
             raise RuntimeError("Extension not connected")
 
         with self._id_lock:
@@ -126,13 +242,16 @@ class Transport:
 
         fut = self._loop.create_future()
         self._pending[msg_id] = fut
-
-        asyncio.run_coroutine_threadsafe(self._ws.send(json.dumps(msg)), self._loop)
+        self._outbox[msg_id] = [method, json.dumps(msg), False]
+        # Sent from the loop; while the extension is reconnecting the request
+        # stays queued and goes out on the next connection.
+        self._loop.call_soon_threadsafe(self._flush, msg_id)
 
         try:
             return self._wait_future(fut, timeout)
         except TimeoutError:
             self._pending.pop(msg_id, None)
+            self._outbox.pop(msg_id, None)
             raise
 
     def _wait_future(self, fut: asyncio.Future, timeout: float) -> object:
@@ -228,6 +347,7 @@ class Transport:
             if not fut.done():
                 fut.cancel()
         self._pending.clear()
+        self._outbox.clear()
 
         if self._ws:
             try:
@@ -241,3 +361,43 @@ class Transport:
 
         if hasattr(self, "_stop_future") and not self._stop_future.done():
             self._stop_future.set_result(None)
+
+
+class TabTransport:
+    """View of a :class:`Transport` that stamps one tab id on every command.
+
+    Any number of views share the parent's socket and event handlers, so
+    threads driving different tabs never touch each other's pinned tab.
+    """
+
+    def __init__(self, transport: Transport, tab_id: int) -> None:
+        self._transport = transport
+        self._pinned_tab_id = tab_id
+
+    def send(
+        self,
+        method: str,
+        params: dict[str, object] | None = None,
+        timeout: float = 30.0,
+        tab_id: int | None = None,
+    ) -> object:
+        return self._transport.send(
+            method,
+            params,
+            timeout=timeout,
+            tab_id=tab_id if tab_id is not None else self._pinned_tab_id,
+        )
+
+    _is_cs_error = staticmethod(Transport._is_cs_error)
+    _send_with_retry = Transport._send_with_retry
+    _send_list = Transport._send_list
+    _send_optional = Transport._send_optional
+
+    def __getattr__(self, name: str) -> object:
+        return getattr(self._transport, name)
+
+    def start(self, timeout: float = 30.0) -> None:
+        raise RuntimeError("A tab view shares its parent's transport")
+
+    def shutdown(self) -> None:
+        pass
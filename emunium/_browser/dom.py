@@ -25,7 +25,7 @@ def query_selector(bridge: Bridge, selector: str) -> Element | None:
 
 def query_selector_all(bridge: Bridge, selector: str) -> list[Element]:
     results = bridge.query_selector_all(selector)
-    return [Element.from_data(bridge, d, selector=selector) for d in results]
+    return Element.from_list(bridge, results, selector=selector)
 
 
 def _wait_with_retry(
@@ -35,6 +35,7 @@ def _wait_with_retry(
     timeout: float,
     state: str | None = None,
     conditions: list[dict] | None = None,
+    filters: list[dict] | None = None,
 ) -> dict | None:
     deadline = time.monotonic() + timeout
     data = None
@@ -49,6 +50,7 @@ def _wait_with_retry(
                 timeout=remaining,
                 state=state,
                 conditions=conditions,
+                filters=filters,
             )
         except Exception:
             data = None
@@ -69,20 +71,45 @@ def wait_for_element(
     state: str | None = None,
     conditions: list[dict] | None = None,
     raise_on_timeout: bool = True,
+    filters: list[dict] | None = None,
 ) -> Element | None:
     logger.info("Waiting for %r (timeout=%.1fs)...", selector, timeout)
     data = _wait_with_retry(
-        bridge, selector, "css", timeout, state=state, conditions=conditions
+        bridge,
+        selector,
+        "css",
+        timeout,
+        state=state,
+        conditions=conditions,
+        filters=filters,
     )
     if data is None:
         if not raise_on_timeout:
             return None
         raise TimeoutError(f"Element not found after {timeout}s: {selector!r}")
-    el = Element.from_data(bridge, data, selector=selector)
+    el = Element.from_data(bridge, data, selector=None if filters else selector)
     logger.info("Element found at Screen(%.0f, %.0f)", el.screen_x, el.screen_y)
     return el
 
 
+def wait_for_elements(
+    bridge: Bridge, selectors: list[str], timeout: float = 10.0
+) -> list[Element]:
+    """Wait for every selector in one content-script call; order is preserved."""
+    logger.info("Waiting for %d selectors (timeout=%.1fs)...", len(selectors), timeout)
+    results = bridge.wait_for_selectors(selectors, timeout) if selectors else []
+    missing = [
+        selector
+        for selector, data in zip(selectors, results)
+        if not data or "error" in data
+    ]
+    if len(results) != len(selectors) or missing:
+        raise TimeoutError(
+            f"Elements not found after {timeout}s: {missing or selectors!r}"
+        )
+    return Element.from_list(bridge, results)
+
+
 def wait_for_xpath(
     bridge: Bridge,
     xpath: str,
@@ -119,9 +146,9 @@ def wait_for_text(
 
 def get_by_text(bridge: Bridge, text: str, *, exact: bool = False) -> list[Element]:
     results = bridge.get_element_by_text(text, exact=exact)
-    return [Element.from_data(bridge, d) for d in results]
+    return Element.from_list(bridge, results)
 
 
 def get_all_interactive(bridge: Bridge) -> list[Element]:
     results = bridge.get_all_interactive()
-    return [Element.from_data(bridge, d) for d in results]
+    return Element.from_list(bridge, results)
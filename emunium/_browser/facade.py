@@ -3,7 +3,20 @@ from __future__ import annotations
 import logging
 
 from emunium._browser import dom, page, tabs
-from emunium._browser.launcher import BrowserSession, close, launch
+from emunium._browser.launcher import (
+    BrowserSession,
+    LaunchOptions,
+    attach,
+    close,
+    disconnect,
+    find_session,
+    launch,
+    resolve_launch_options,
+)
+from emunium._browser.locator import LiveLocator
+from emunium._browser.process import ProcessMonitor, ResourceSample
+from emunium._browser.profile import ProfileTemplate
+from emunium._input.backend import InputBackend, set_backend
 from emunium._standalone.config import ClickType
 from emunium.bridge import Bridge
 from emunium.element import Element
@@ -12,48 +25,63 @@ from emunium.wait import Wait, WaitStrategy
 logger = logging.getLogger("emunium.browser")
 
 
-class Browser:
-    def __init__(
-        self,
-        headless: bool = False,
-        user_data_dir: str | None = None,
-        bridge_port: int = 0,
-        bridge_timeout: float = 60.0,
-    ) -> None:
-        self._session = BrowserSession()
-        self._session.bridge = Bridge(port=bridge_port)
-        self._session.headless = headless
-        self._session.user_data_dir = user_data_dir
-        self._bridge_timeout = bridge_timeout
+class Page:
+    """Handle on one browser tab.
+
+    Every command carries the tab's id, so threads holding different pages
+    drive their tabs independently over one connection. DOM queries, waits,
+    reads, scripts and network waits work in background tabs; mouse and
+    keyboard input is real OS input and reaches whichever tab is visible, so
+    call :meth:`bring_to_front` before acting on a page.
+    """
+
+    def __init__(self, bridge: Bridge, timings: dict[str, float] | None = None) -> None:
+        self._bridge = bridge
+        self._timings = timings if timings is not None else {}
 
     @property
     def bridge(self) -> Bridge:
-        return self._session.bridge
+        return self._bridge
 
-    def launch(self) -> Browser:
-        launch(self._session, bridge_timeout=self._bridge_timeout)
-        return self
+    @property
+    def tab_id(self) -> int | None:
+        return self._bridge.pinned_tab_id
 
-    def close(self) -> None:
-        close(self._session)
+    @property
+    def timings(self) -> dict[str, float]:
+        """Seconds spent in the last :meth:`goto`, plus launch phases on a Browser."""
+        return dict(self._timings)
 
     def goto(self, url: str, *, timeout: float = 30.0) -> dict:
-        return page.goto(self._session.bridge, url, timeout=timeout)
+        return page.goto(self.bridge, url, timeout=timeout, timings=self._timings)
 
     def query_selector(self, selector: str) -> Element | None:
-        return dom.query_selector(self._session.bridge, selector)
+        return dom.query_selector(self.bridge, selector)
 
     def query_selector_all(self, selector: str) -> list[Element]:
-        return dom.query_selector_all(self._session.bridge, selector)
+        return dom.query_selector_all(self.bridge, selector)
+
+    def locator(
+        self,
+        selector: str,
+        *,
+        has_text: str | None = None,
+        timeout: float = 10.0,
+    ) -> LiveLocator:
+        """Lazy, auto-waiting handle; resolved only when an action or read runs."""
+        loc = LiveLocator(self.bridge, selector, timeout=timeout)
+        if has_text is not None:
+            loc = loc.filter(has_text=has_text)
+        return loc
 
     def wait_for_element(self, selector: str, timeout: float = 10.0) -> Element:
-        return dom.wait_for_element(self._session.bridge, selector, timeout)
+        return dom.wait_for_element(self.bridge, selector, timeout)
 
     def wait_for_xpath(self, xpath: str, timeout: float = 10.0) -> Element:
-        return dom.wait_for_xpath(self._session.bridge, xpath, timeout)
+        return dom.wait_for_xpath(self.bridge, xpath, timeout)
 
     def wait_for_text(self, text: str, timeout: float = 10.0) -> Element:
-        return dom.wait_for_text(self._session.bridge, text, timeout)
+        return dom.wait_for_text(self.bridge, text, timeout)
 
     def wait(
         self,
@@ -71,7 +99,7 @@ class Browser:
         else:
             conditions = None
         return dom.wait_for_element(
-            self._session.bridge,
+            self.bridge,
             selector,
             timeout,
             state=state,
@@ -80,17 +108,17 @@ class Browser:
         )
 
     def get_by_text(self, text: str, *, exact: bool = False) -> list[Element]:
-        return dom.get_by_text(self._session.bridge, text, exact=exact)
+        return dom.get_by_text(self.bridge, text, exact=exact)
 
     def get_all_interactive(self) -> list[Element]:
-        return dom.get_all_interactive(self._session.bridge)
+        return dom.get_all_interactive(self.bridge)
 
     def _resolve_element(
         self, target: str | Element, *, timeout: float = 10.0
     ) -> Element:
         if isinstance(target, Element):
             return target
-        return dom.wait_for_element(self._session.bridge, target, timeout)
+        return dom.wait_for_element(self.bridge, target, timeout)
 
     def click(
         self,
@@ -166,6 +194,7 @@ class Browser:
         characters_per_minute: int = 280,
         offset: int = 20,
         human: bool = True,
+        paste_threshold: int | None = None,
     ) -> Element:
         el = self._resolve_element(selector)
         el.type(
@@ -173,9 +202,46 @@ class Browser:
             characters_per_minute=characters_per_minute,
             offset=offset,
             human=human,
+            paste_threshold=paste_threshold,
         )
         return el
 
+    def fill(
+        self,
+        fields: dict[str, str],
+        *,
+        characters_per_minute: int = 280,
+        offset: int = 20,
+        human: bool = True,
+        paste_threshold: int | None = None,
+        timeout: float = 10.0,
+        keep_order: bool = False,
+    ) -> dict[str, Element]:
+        """Type into several fields, resolving all of them in one round trip.
+
+        Fields are filled top-to-bottom, left-to-right unless *keep_order* is
+        set, and the cursor path to the next field is planned while the
+        current one is being typed. Returns the elements in fill order.
+        """
+        selectors = list(fields)
+        elements = dom.wait_for_elements(self.bridge, selectors, timeout)
+        order = list(zip(selectors, elements))
+        if not keep_order:
+            order.sort(
+                key=lambda item: (item[1].rect.get("y", 0), item[1].rect.get("x", 0))
+            )
+        for index, (selector, el) in enumerate(order):
+            if human and index + 1 < len(order):
+                el._prepare_path_to(order[index + 1][1])
+            el.type(
+                fields[selector],
+                characters_per_minute=characters_per_minute,
+                offset=offset,
+                human=human,
+                paste_threshold=paste_threshold,
+            )
+        return dict(order)
+
     def type_at(
         self,
         target: str | Element,
@@ -186,6 +252,7 @@ class Browser:
         human: bool = True,
         click_type: ClickType = ClickType.LEFT,
         timeout: float = 10.0,
+        paste_threshold: int | None = None,
     ) -> Element:
         el = self._resolve_element(target, timeout=timeout)
         el.type(
@@ -194,6 +261,7 @@ class Browser:
             offset=offset,
             human=human,
             click_type=click_type,
+            paste_threshold=paste_threshold,
         )
         return el
 
@@ -205,44 +273,167 @@ class Browser:
         source.drag_to(target, human=human)
 
     def execute_script(self, code: str) -> str | None:
-        return page.execute_script(self._session.bridge, code)
+        return page.execute_script(self.bridge, code)
 
     def page_info(self) -> dict:
-        return page.page_info(self._session.bridge)
+        return page.page_info(self.bridge)
 
     def scroll_to(self, target: int | str | Element, y: int | None = None) -> dict:
         if isinstance(target, (str, Element)):
             return self._resolve_element(target).scroll_into_view()
         if y is None:
             raise TypeError("scroll_to() missing y coordinate")
-        return page.scroll_to(self._session.bridge, target, y)
+        return page.scroll_to(self.bridge, target, y)
 
     @property
     def url(self) -> str:
-        return page.get_url(self._session.bridge)
+        return page.get_url(self.bridge)
 
     @property
     def title(self) -> str:
-        return page.get_title(self._session.bridge)
-
-    def new_tab(self, url: str = "about:blank") -> dict:
-        return tabs.new_tab(self._session.bridge, url)
-
-    def close_tab(self, tab_id: int | None = None) -> dict:
-        return tabs.close_tab(self._session.bridge, tab_id)
+        return page.get_title(self.bridge)
 
     def tab_info(self) -> dict:
-        return tabs.tab_info(self._session.bridge)
+        return tabs.tab_info(self.bridge)
 
     def wait_for_idle(self, silence: float = 2.0, timeout: float = 30.0) -> bool:
-        return page.wait_for_idle(self._session.bridge, silence, timeout)
+        return page.wait_for_idle(self.bridge, silence, timeout)
 
     def wait_for_response(self, url_pattern: str, timeout: float = 10.0) -> dict | None:
         """Wait for a network response matching *url_pattern* (glob)."""
-        return self._session.bridge.wait_for_response(url_pattern, timeout)
+        return self.bridge.wait_for_response(url_pattern, timeout)
 
-    def __enter__(self) -> Browser:
-        return self.launch()
+    def bring_to_front(self) -> dict:
+        """Activate this tab and focus its window."""
+        return tabs.activate(self.bridge)
+
+    def close(self) -> None:
+        """Close the tab and stop tracking its events."""
+        try:
+            tabs.close_tab(self.bridge, self.tab_id)
+        finally:
+            self._bridge.detach()
+
+    def __enter__(self) -> Page:
+        return self
 
     def __exit__(self, *exc: object) -> None:
         self.close()
+
+
+class Browser(Page):
+    def __init__(
+        self,
+        headless: bool = False,
+        user_data_dir: str | None = None,
+        bridge_port: int = 0,
+        bridge_timeout: float = 60.0,
+        input_backend: str | InputBackend | None = None,
+        profile_template: ProfileTemplate | None = None,
+        launch_options: LaunchOptions | str | None = None,
+        daemon: bool = False,
+    ) -> None:
+        if user_data_dir and profile_template is not None:
+            raise ValueError("user_data_dir and profile_template are exclusive")
+        if input_backend is not None:
+            set_backend(input_backend)
+        self._session = BrowserSession()
+        self._session.bridge = Bridge(port=bridge_port)
+        self._session.headless = headless
+        self._session.user_data_dir = user_data_dir
+        self._session.profile_template = profile_template
+        self._session.options = resolve_launch_options(launch_options)
+        self._session.daemon = daemon
+        self._bridge_timeout = bridge_timeout
+        super().__init__(self._session.bridge, self._session.timings)
+
+    @property
+    def pid(self) -> int | None:
+        """Process id of the launched or attached Chrome, ``None`` before that."""
+        return self._session.pid
+
+    @property
+    def monitor(self) -> ProcessMonitor | None:
+        """CPU/RSS monitor of the Chrome process tree, ``None`` before launch."""
+        return self._session.monitor
+
+    def resources(self) -> ResourceSample | None:
+        """Sample CPU and resident memory of the whole Chrome process tree.
+
+        ``None`` before launch or where ``/proc`` is unavailable.
+        """
+        monitor = self._session.monitor
+        return monitor.sample() if monitor else None
+
+    @property
+    def session_token(self) -> str | None:
+        """Token identifying this Chrome for :meth:`attach`."""
+        return self._session.token
+
+    @classmethod
+    def attach(
+        cls,
+        token: str | None = None,
+        *,
+        port: int | None = None,
+        timeout: float = 30.0,
+    ) -> Browser:
+        """Bridge to a running emunium Chrome instead of launching one.
+
+        Looks the session up by *token*, by bridge *port*, or takes the most
+        recently launched one when neither is given. A bare *port* with no
+        session record still works, without token checking.
+        """
+        record = find_session(token, port)
+        if record is None and (token is not None or port is None):
+            raise RuntimeError("No running emunium Chrome session found")
+        browser = cls(bridge_port=record["port"] if record else port)
+        attach(browser._session, record, timeout)
+        return browser
+
+    def disconnect(self) -> None:
+        """Drop the bridge but leave Chrome running for a later :meth:`attach`."""
+        disconnect(self._session)
+
+    def launch(self) -> Browser:
+        launch(self._session, bridge_timeout=self._bridge_timeout)
+        return self
+
+    def close(self, *, wait: bool = True) -> None:
+        """Shut Chrome down; with ``wait=False``, return before it has exited."""
+        close(self._session, wait=wait)
+
+    def new_tab(self, url: str = "about:blank") -> dict:
+        return tabs.new_tab(self._session.bridge, url)
+
+    def close_tab(self, tab_id: int | None = None) -> dict:
+        return tabs.close_tab(self._session.bridge, tab_id)
+
+    def reset(self, timeout: float = 30.0) -> dict:
+        """Close every tab but a fresh blank one and clear cookies, storage and caches."""
+        return tabs.reset(self._session.bridge, timeout)
+
+    def new_page(self, url: str = "about:blank", *, active: bool = False) -> Page:
+        """Open a tab and return a :class:`Page` bound to it.
+
+        With *url* other than ``about:blank`` the page is navigated (and
+        waited for) before it is returned.
+        """
+        bridge = self._session.bridge
+        if bridge.pinned_tab_id is None:
+            bridge.pinned_tab_id = tabs.tab_info(bridge).get("tabId")
+        info = tabs.new_tab(bridge, "about:blank", active=active)
+        new = Page(bridge.for_tab(info["tabId"]))
+        if url != "about:blank":
+            new.goto(url)
+        return new
+
+    def __enter__(self) -> Browser:
+        return self if self.bridge.connected else self.launch()
+
+    def __exit__(self, *exc: object) -> None:
+        # An attached Chrome belongs to whoever launched it.
+        if self._session.daemon or self._session.attached:
+            self.disconnect()
+        else:
+            self.close()
@@ -2,18 +2,101 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import secrets
 import shutil
+import signal
 import subprocess
+import sys
 import tempfile
 import time
+from concurrent.futures import Future
+from dataclasses import dataclass
 from pathlib import Path
 
+from emunium._browser.process import ProcessMonitor, process_state, process_tree
+from emunium._browser.profile import ProfileTemplate, discard_profile
+from emunium._browser.reaper import get_reaper
 from emunium.bridge import Bridge
 from emunium.chrome_installer import ensure_chrome
 
 logger = logging.getLogger("emunium.browser")
 
 EXTENSION_DIR = str(Path(__file__).resolve().parent.parent / "extension")
+_SESSION_EXTENSION = "emunium_extension"
+# Session records hold tokens, so they live in a private per-user directory.
+SESSIONS_DIR = Path(tempfile.gettempdir()) / (
+    f"emunium_sessions-{os.getuid()}" if hasattr(os, "getuid") else "emunium_sessions"
+)
+_BASE_DISABLED_FEATURES = ("IsolateOrigins", "site-per-process")
+
+
+@dataclass(frozen=True)
+class LaunchOptions:
+    """Chrome resource knobs; see :data:`LAUNCH_PRESETS` for named bundles.
+
+    *renderer_process_limit* caps renderer processes (tabs share them beyond
+    the cap). *throttle_background* keeps Chrome's timer throttling and
+    renderer backgrounding for hidden tabs; turn it off when background
+    :class:`Page` handles must run at full speed. *memory_saver* trades speed
+    for footprint: low-end-device mode, one process per site, no
+    back/forward cache and no background networking or component updates.
+    """
+
+    renderer_process_limit: int | None = None
+    disable_gpu: bool = False
+    throttle_background: bool = True
+    memory_saver: bool = False
+    disable_features: tuple[str, ...] = ()
+    extra_args: tuple[str, ...] = ()
+
+    def args(self) -> list[str]:
+        args: list[str] = []
+        disabled = list(_BASE_DISABLED_FEATURES) + list(self.disable_features)
+        if self.renderer_process_limit:
+            args.append(f"--renderer-process-limit={self.renderer_process_limit}")
+        if self.disable_gpu:
+            args += ["--disable-gpu", "--disable-software-rasterizer"]
+        if not self.throttle_background:
+            args += [
+                "--disable-background-timer-throttling",
+                "--disable-backgrounding-occluded-windows",
+                "--disable-renderer-backgrounding",
+            ]
+        if self.memory_saver:
+            args += [
+                "--enable-low-end-device-mode",
+                "--process-per-site",
+                "--disable-background-networking",
+                "--disable-component-update",
+            ]
+            disabled.append("BackForwardCache")
+        args.append("--disable-features=" + ",".join(dict.fromkeys(disabled)))
+        return args + list(self.extra_args)
+
+
+LAUNCH_PRESETS: dict[str, LaunchOptions] = {
+    "default": LaunchOptions(),
+    "background": LaunchOptions(throttle_background=False),
+    "lean": LaunchOptions(
+        renderer_process_limit=4, disable_gpu=True, memory_saver=True
+    ),
+    "dense": LaunchOptions(
+        renderer_process_limit=1, disable_gpu=True, memory_saver=True
+    ),
+}
+
+
+def resolve_launch_options(options: LaunchOptions | str | None) -> LaunchOptions:
+    if options is None:
+        return LAUNCH_PRESETS["default"]
+    if isinstance(options, str):
+        if options not in LAUNCH_PRESETS:
+            raise ValueError(
+                f"Unknown launch preset {options!r}; expected one of {sorted(LAUNCH_PRESETS)}"
+            )
+        return LAUNCH_PRESETS[options]
+    return options
 
 
 class BrowserSession:
@@ -24,6 +107,16 @@ class BrowserSession:
         "user_data_dir",
         "tmp_data_dir",
         "chrome_path",
+        "extension_dir",
+        "profile_template",
+        "options",
+        "monitor",
+        "timings",
+        "pid",
+        "token",
+        "daemon",
+        "teardown",
+        "attached",
     )
 
     def __init__(self) -> None:
@@ -33,80 +126,357 @@ class BrowserSession:
         self.user_data_dir: str | None = None
         self.tmp_data_dir: str | None = None
         self.chrome_path: str = ""
+        self.extension_dir: str | None = None
+        self.profile_template: ProfileTemplate | None = None
+        self.options: LaunchOptions = LAUNCH_PRESETS["default"]
+        self.monitor: ProcessMonitor | None = None
+        self.timings: dict[str, float] = {}
+        self.pid: int | None = None
+        self.token: str | None = None
+        self.daemon: bool = False
+        self.teardown: Future | None = None
+        self.attached: bool = False
 
 
 def launch(session: BrowserSession, bridge_timeout: float = 60.0) -> None:
+    if session.teardown is not None:
+        # The bridge is reused, so a background close must finish first.
+        session.teardown.result()
+        session.teardown = None
+    session.attached = False
+    timings = session.timings
+    started = phase = time.perf_counter()
     session.chrome_path = ensure_chrome()
+    phase = _lap(timings, "ensure_chrome", phase)
+    session.token = session.bridge.token = secrets.token_hex(16)
     session.bridge.start()
     port = session.bridge.actual_port
     logger.info("Bridge started on port %d", port)
+    phase = _lap(timings, "bridge_start", phase)
 
+    _write_master_preferences(session.chrome_path)
     if session.user_data_dir:
         data_dir = str(Path(session.user_data_dir).resolve())
+        _seed_profile(data_dir)
+    elif session.profile_template is not None:
+        session.tmp_data_dir = session.profile_template.clone()
+        data_dir = session.tmp_data_dir
+        logger.info("Cloned profile template: %s", data_dir)
     else:
         session.tmp_data_dir = tempfile.mkdtemp(prefix="emun_profile_")
         data_dir = session.tmp_data_dir
         logger.info("Created temp profile: %s", data_dir)
-
-    _write_master_preferences(session.chrome_path)
-    _seed_profile(data_dir)
-    _patch_extension_port(port)
+        _seed_profile(data_dir)
+    session.extension_dir = _prepare_extension(data_dir, port, session.token)
+    phase = _lap(timings, "profile", phase)
 
     args = [
         session.chrome_path,
         f"--user-data-dir={data_dir}",
-        "--disable-features=IsolateOrigins,site-per-process",
         "--no-first-run",
         "--no-default-browser-check",
         "--disable-popup-blocking",
-        f"--load-extension={EXTENSION_DIR}",
+        f"--load-extension={session.extension_dir}",
+        *session.options.args(),
     ]
     if session.headless:
         args.append("--headless=new")
 
-    session.process = subprocess.Popen(args)
-    time.sleep(2)
+    # A daemon Chrome gets its own session so it outlives this process and
+    # ignores the job's Ctrl-C; ``attach`` picks it up later.
+    session.process = subprocess.Popen(args, start_new_session=session.daemon)
+    session.pid = session.process.pid
+    session.monitor = ProcessMonitor(session.pid)
+    phase = _lap(timings, "spawn", phase)
+
+    _wait_for_extension(session, bridge_timeout)
+    _lap(timings, "connect", phase)
+    _write_record(session, port)
+    timings["launch"] = time.perf_counter() - started
+    logger.info(
+        "Extension connected to bridge in %.2fs (%s)",
+        timings["launch"],
+        ", ".join(f"{k}={v:.2f}s" for k, v in timings.items() if k != "launch"),
+    )
+
+
+def _lap(timings: dict[str, float], name: str, since: float) -> float:
+    now = time.perf_counter()
+    timings[name] = now - since
+    return now
+
+
+def _wait_for_extension(session: BrowserSession, timeout: float) -> None:
+    """Block until the extension's WebSocket handshake completes.
+
+    Polls in short slices so a Chrome process that dies during startup is
+    reported at once instead of after the full *timeout*.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise RuntimeError("Extension did not connect within timeout")
+        if session.bridge.wait_for_connection(timeout=min(0.25, remaining)):
+            return
+        if session.process is not None:
+            code = session.process.poll()
+            if code is not None:
+                raise RuntimeError(
+                    f"Chrome exited with code {code} before the extension connected"
+                )
+        elif session.pid is not None and not _pid_alive(session.pid):
+            raise RuntimeError(f"Chrome process {session.pid} is no longer running")
 
-    connected = session.bridge.wait_for_connection(timeout=bridge_timeout)
-    if not connected:
-        raise RuntimeError("Extension did not connect within timeout")
-    logger.info("Extension connected to bridge")
 
+def _pid_alive(pid: int) -> bool:
+    if sys.platform == "win32":
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
 
-def close(session: BrowserSession) -> None:
-    if session.process:
-        session.process.terminate()
+
+def _terminate_pid(pid: int, timeout: float = 5.0) -> None:
+    """Stop a Chrome this process did not spawn (an attached session)."""
+    try:
+        os.kill(pid, signal.SIGTERM)
+    except OSError:
+        return
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if not _pid_alive(pid):
+            return
+        time.sleep(0.05)
+    if sys.platform != "win32":
         try:
-            session.process.wait(timeout=5)
-        except Exception:
-            session.process.kill()
-        session.process = None
+            os.kill(pid, signal.SIGKILL)
+        except OSError:
+            pass
+
+
+def _private_sessions_dir() -> bool:
+    SESSIONS_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if not hasattr(os, "getuid"):
+        return True
+    info = SESSIONS_DIR.lstat()
+    if SESSIONS_DIR.is_symlink() or info.st_uid != os.getuid():
+        logger.warning(
+            "%s is not owned by this user; not recording session", SESSIONS_DIR
+        )
+        return False
+    if info.st_mode & 0o077:
+        os.chmod(SESSIONS_DIR, 0o700)
+    return True
+
+
+def _write_record(session: BrowserSession, port: int) -> None:
+    if not _private_sessions_dir():
+        return
+    record = {
+        "token": session.token,
+        "port": port,
+        "pid": session.pid,
+        "headless": session.headless,
+        "daemon": session.daemon,
+        "user_data_dir": session.user_data_dir,
+        "tmp_data_dir": session.tmp_data_dir,
+        "extension_dir": session.extension_dir,
+        "started": time.time(),
+    }
+    path = SESSIONS_DIR / f"{session.token}.json"
+    tmp = path.with_suffix(".tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(json.dumps(record))
+    os.replace(tmp, path)
+
+
+def _remove_record(token: str | None) -> None:
+    if token:
+        (SESSIONS_DIR / f"{token}.json").unlink(missing_ok=True)
+
+
+def find_session(token: str | None = None, port: int | None = None) -> dict | None:
+    """Record of a running emunium Chrome, by token, by port or the newest one.
+
+    Records whose Chrome has exited are removed on the way.
+    """
+    if token is not None:
+        paths = [SESSIONS_DIR / f"{token}.json"]
+    elif SESSIONS_DIR.is_dir():
+        paths = list(SESSIONS_DIR.glob("*.json"))
+    else:
+        paths = []
+    found = []
+    for path in paths:
+        try:
+            record = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        if record.get("pid") and not _pid_alive(record["pid"]):
+            path.unlink(missing_ok=True)
+            continue
+        if port is None or record.get("port") == port:
+            found.append(record)
+    return max(found, key=lambda r: r.get("started", 0), default=None)
+
+
+def attach(session: BrowserSession, record: dict | None, timeout: float = 30.0) -> None:
+    """Bridge to an already-running Chrome instead of launching one.
+
+    The extension keeps retrying the port in its ``port.json``, so listening
+    on that port again is enough; it reconnects within its retry interval
+    (at most a few seconds) and presents the session token.
+    """
+    started = time.perf_counter()
+    if record is not None:
+        session.token = session.bridge.token = record.get("token")
+        session.pid = record.get("pid")
+        session.headless = bool(record.get("headless"))
+        session.daemon = bool(record.get("daemon"))
+        session.user_data_dir = record.get("user_data_dir")
+        session.tmp_data_dir = record.get("tmp_data_dir")
+        session.extension_dir = record.get("extension_dir")
+    try:
+        session.bridge.start()
+    except OSError as e:
+        raise RuntimeError(
+            f"Bridge port is busy; is the session still attached elsewhere? ({e})"
+        ) from e
+    _wait_for_extension(session, timeout)
+    session.attached = True
+    if session.pid is not None:
+        session.monitor = ProcessMonitor(session.pid)
+    info = session.bridge.get_tab_info()
+    if info and info.get("tabId") is not None:
+        session.bridge.pinned_tab_id = info["tabId"]
+    session.timings["attach"] = time.perf_counter() - started
+    logger.info("Attached to Chrome in %.2fs", session.timings["attach"])
+
+
+def disconnect(session: BrowserSession) -> None:
+    """Stop the bridge but leave Chrome running for a later :func:`attach`."""
+    if session.monitor:
+        session.monitor.stop()
+        session.monitor = None
     session.bridge.shutdown()
-    _restore_extension()
-    if session.tmp_data_dir:
+    session.process = None
+    logger.info("Disconnected from Chrome (session %s)", session.token)
+
+
+def close(session: BrowserSession, *, wait: bool = True) -> None:
+    """Stop Chrome and the bridge and discard the temp profile.
+
+    With ``wait=False`` the session is detached at once and the slow part
+    (terminating the process tree, closing the bridge) runs on the reaper,
+    which logs anything left behind. The temp profile is deleted on the
+    reaper once Chrome has exited, in both modes.
+    """
+    if session.monitor:
+        session.monitor.stop()
+        session.monitor = None
+    process, pid, bridge = session.process, session.pid, session.bridge
+    profile = session.tmp_data_dir
+    session.process = session.pid = session.tmp_data_dir = None
+    _remove_record(session.token)
+    session.extension_dir = None
+    if wait:
+        _stop(process, pid, bridge, profile)
+        logger.info("Browser closed")
+    else:
+        session.teardown = get_reaper().submit(_stop, process, pid, bridge, profile)
+        logger.info("Browser closing in the background")
+
+
+def _stop(
+    process: subprocess.Popen | None,
+    pid: int | None,
+    bridge: Bridge | None,
+    profile: str | None = None,
+) -> None:
+    tree = process_tree(pid)[1:] if pid and ProcessMonitor.available else []
+    if process:
+        process.terminate()
         try:
-            shutil.rmtree(session.tmp_data_dir, ignore_errors=True)
-        except Exception:
-            pass
-        session.tmp_data_dir = None
-    logger.info("Browser closed")
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                get_reaper().leak("process", f"Chrome {pid} survived SIGKILL")
+    elif pid is not None:
+        _terminate_pid(pid)
+        if _pid_alive(pid):
+            get_reaper().leak("process", f"Chrome {pid} survived SIGKILL")
+    if bridge is not None:
+        bridge.shutdown()
+    _sweep(tree)
+    # Only once the whole tree is gone: Chrome writes its profile on exit.
+    if profile:
+        discard_profile(profile)
+
 
+def _sweep(pids: list[int], grace: float = 2.0) -> None:
+    """Kill Chrome helpers that outlived the browser process."""
+    deadline = time.monotonic() + grace
+    while pids and time.monotonic() < deadline:
+        pids = [p for p in pids if process_state(p) is not None]
+        if pids:
+            time.sleep(0.05)
+    for member in pids:
+        try:
+            os.kill(member, signal.SIGKILL)
+        except OSError:
+            pass
+    if pids:
+        time.sleep(0.1)
+    for member in pids:
+        state = process_state(member)
+        if state == "Z":
+            get_reaper().leak("zombie", f"Chrome helper {member} was not reaped")
+        elif state is not None:
+            get_reaper().leak("process", f"Chrome helper {member} survived SIGKILL")
 
-def _patch_extension_port(port: int) -> None:
-    port_file = Path(EXTENSION_DIR) / "port.json"
-    port_file.write_text(json.dumps({"port": port}), encoding="utf-8")
 
+def _prepare_extension(data_dir: str, port: int, token: str | None = None) -> str:
+    """Give the profile its own extension tree with this session's port.
 
-def _restore_extension() -> None:
-    port_file = Path(EXTENSION_DIR) / "port.json"
-    if port_file.exists():
-        port_file.unlink(missing_ok=True)
+    Files are hardlinked from the package (copied where linking is not
+    possible) and ``port.json`` (port and session token) is written only
+    into the copy, so browsers launched in parallel never read each other's
+    bridge port. Chrome's profile lock already keeps two sessions off the
+    same profile.
+    """
+    target = Path(data_dir) / _SESSION_EXTENSION
+    shutil.rmtree(target, ignore_errors=True)
+    target.mkdir(parents=True)
+    for source in Path(EXTENSION_DIR).iterdir():
+        if not source.is_file() or source.name == "port.json":
+            continue
+        try:
+            os.link(source, target / source.name)
+        except OSError:
+            shutil.copy2(source, target / source.name)
+    config = {"port": port, "token": token}
+    (target / "port.json").write_text(json.dumps(config), encoding="utf-8")
+    return str(target)
 
 
 def _write_master_preferences(chrome_path: str) -> None:
     master = Path(chrome_path).parent / "master_preferences"
-    payload = {"extensions": {"ui": {"developer_mode": True}}}
-    master.write_text(json.dumps(payload), encoding="utf-8")
+    payload = json.dumps({"extensions": {"ui": {"developer_mode": True}}})
+    try:
+        if master.read_text(encoding="utf-8") == payload:
+            return
+    except OSError:
+        pass
+    master.write_text(payload, encoding="utf-8")
 
 
 def _seed_profile(data_dir: str) -> None:
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from emunium._browser import dom
+from emunium._standalone.config import ClickType
+from emunium.bridge import Bridge
+from emunium.element import Element
+from emunium.locator import ROLE_SELECTOR_MAP
+from emunium.wait import Wait, WaitStrategy
+
+
+class LiveLocator:
+    """Lazy handle to elements on the live page.
+
+    Filters are composed in Python and nothing is sent to the page until an
+    action or read runs. Actions resolve the target in a single
+    ``waitForSelector`` call, so they auto-wait for the element to appear.
+    """
+
+    def __init__(
+        self,
+        bridge: Bridge,
+        selector: str,
+        filters: tuple[dict, ...] = (),
+        *,
+        timeout: float = 10.0,
+    ) -> None:
+        self._bridge = bridge
+        self._selector = selector
+        self._filters = filters
+        self._timeout = timeout
+
+    @property
+    def selector(self) -> str:
+        return self._selector
+
+    def _with(self, filter_: dict) -> LiveLocator:
+        return LiveLocator(
+            self._bridge,
+            self._selector,
+            self._filters + (filter_,),
+            timeout=self._timeout,
+        )
+
+    def filter(
+        self, *, has_text: str | None = None, role: str | None = None
+    ) -> LiveLocator:
+        loc = self
+        if role is not None:
+            selector = ROLE_SELECTOR_MAP.get(role, f'[role="{role}"]')
+            loc = loc._with({"type": "matches", "selector": selector})
+        if has_text is not None:
+            loc = loc._with({"type": "has_text", "value": has_text})
+        return loc
+
+    def nth(self, index: int) -> LiveLocator:
+        return self._with({"type": "nth", "index": index})
+
+    @property
+    def first(self) -> LiveLocator:
+        return self.nth(0)
+
+    @property
+    def last(self) -> LiveLocator:
+        return self.nth(-1)
+
+    def count(self) -> int:
+        return self._bridge.locator_count(self._selector, list(self._filters))
+
+    def all(self) -> list[Element]:
+        results = self._bridge.locator_all(self._selector, list(self._filters))
+        return Element.from_list(self._bridge, results)
+
+    def element(
+        self,
+        *,
+        strategy: WaitStrategy | None = None,
+        condition: Wait | None = None,
+        timeout: float | None = None,
+    ) -> Element:
+        state = strategy.value if isinstance(strategy, WaitStrategy) else strategy
+        return dom.wait_for_element(
+            self._bridge,
+            self._selector,
+            timeout if timeout is not None else self._timeout,
+            state=state,
+            conditions=condition.to_payload() if condition is not None else None,
+            filters=list(self._filters),
+        )
+
+    def wait_for(
+        self,
+        *,
+        strategy: WaitStrategy | None = WaitStrategy.VISIBLE,
+        condition: Wait | None = None,
+        timeout: float | None = None,
+    ) -> Element:
+        return self.element(strategy=strategy, condition=condition, timeout=timeout)
+
+    def click(
+        self, *, human: bool = True, click_type: ClickType = ClickType.LEFT
+    ) -> Element:
+        el = self.element()
+        el._click(click_type, human=human)
+        return el
+
+    def double_click(self, *, human: bool = True) -> Element:
+        return self.click(human=human, click_type=ClickType.DOUBLE)
+
+    def right_click(self, *, human: bool = True) -> Element:
+        return self.click(human=human, click_type=ClickType.RIGHT)
+
+    def hover(self, *, human: bool = True) -> Element:
+        el = self.element()
+        el.hover(human=human)
+        return el
+
+    def type(
+        self,
+        text: str,
+        *,
+        characters_per_minute: int = 280,
+        offset: int = 20,
+        human: bool = True,
+        paste_threshold: int | None = None,
+    ) -> Element:
+        el = self.element()
+        el.type(
+            text,
+            characters_per_minute=characters_per_minute,
+            offset=offset,
+            human=human,
+            paste_threshold=paste_threshold,
+        )
+        return el
+
+    def focus(self) -> dict:
+        return self.element().focus()
+
+    def inner_text(self) -> str:
+        return self.element().text
+
+    def get_attribute(self, name: str) -> str | None:
+        return self.element().attrs.get(name)
+
+    def __repr__(self) -> str:
+        return f"LiveLocator({self._selector!r}, filters={list(self._filters)})"
@@ -8,15 +8,33 @@ from emunium.bridge import Bridge
 logger = logging.getLogger("emunium.browser")
 
 
-def goto(bridge: Bridge, url: str, *, timeout: float = 30.0) -> dict:
+def goto(
+    bridge: Bridge,
+    url: str,
+    *,
+    timeout: float = 30.0,
+    timings: dict[str, float] | None = None,
+) -> dict:
+    """Navigate the pinned tab and return once its content script is ready.
+
+    The extension resolves only after the tab finished loading and the
+    content script announced itself, so no settle delay is needed here.
+    """
+    started = time.perf_counter()
     result = bridge.navigate(url, timeout=timeout)
     if result and result.get("error"):
         raise RuntimeError(f"Navigation failed: {result['error']}")
     tab_id = result.get("tabId") if result else None
     if tab_id is not None:
         bridge.pinned_tab_id = tab_id
+    if timings is not None:
+        timings["goto"] = time.perf_counter() - started
+        breakdown = (result or {}).get("timing") or {}
+        timings["goto_load"] = breakdown.get("loadMs", 0.0) / 1000
+        timings["goto_content_ready"] = breakdown.get("contentReadyMs", 0.0) / 1000
+    if result and result.get("contentReady") is False:
+        logger.warning("Content script not ready after navigating to: %s", url)
     logger.info("Navigated to: %s", url)
-    time.sleep(0.5)
     return result or {}
 
 
@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import functools
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+from emunium._browser.facade import Browser
+from emunium._browser.launcher import LaunchOptions
+from emunium._browser.profile import ProfileTemplate
+from emunium._browser.reaper import get_reaper
+
+logger = logging.getLogger("emunium.browser")
+
+_RETRY_DELAY = 0.5
+_MAX_RETRY_DELAY = 30.0
+_POLL = 0.5
+# Consecutive launch failures after which acquire() stops waiting.
+_FAILURES_TO_RAISE = 3
+
+
+class BrowserPool:
+    """Pre-launched, connected browsers handed out one lease at a time.
+
+    Browsers are launched in parallel on :meth:`start`. A lease takes an idle
+    browser off a queue, so the first command can run at once. On release the
+    browser is reset (one blank tab, cookies, storage and caches cleared) on
+    a background thread before it becomes idle again. A browser is replaced
+    by a fresh one after *max_uses* leases, when its process tree's resident
+    memory exceeds *max_rss_mb*, when its reset fails or when it has lost its
+    extension connection; the old one is shut down on the reaper, so the
+    replacement launch does not wait for it. A failed launch is logged and
+    retried with backoff. When the pool has no browser at all and the last
+    few launches in a row failed, :meth:`acquire` raises instead of waiting.
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        *,
+        max_uses: int = 50,
+        max_rss_mb: float | None = None,
+        headless: bool = False,
+        bridge_timeout: float = 60.0,
+        profile_template: ProfileTemplate | None = None,
+        launch_options: LaunchOptions | str | None = None,
+        factory: Callable[[], Browser] | None = None,
+    ) -> None:
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self.size = size
+        self.max_uses = max_uses
+        self.max_rss_mb = max_rss_mb
+        self._factory = factory or functools.partial(
+            Browser,
+            headless=headless,
+            bridge_timeout=bridge_timeout,
+            profile_template=profile_template,
+            launch_options=launch_options,
+        )
+        self._idle: queue.Queue[Browser] = queue.Queue()
+        self._uses: dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=size, thread_name_prefix="emun-pool"
+        )
+        self._started = False
+        self._closed = False
+        self._closing = threading.Event()
+        self._launch_error: Exception | None = None
+        self._failures = 0
+        self._launching = 0
+
+    @property
+    def idle(self) -> int:
+        """Number of browsers ready to be leased right now."""
+        return self._idle.qsize()
+
+    def start(self, *, wait: bool = True) -> BrowserPool:
+        """Launch the browsers; with *wait*, block until all are connected.
+
+        With *wait*, a failed launch closes the pool and is re-raised.
+        """
+        with self._lock:
+            if self._started:
+                return self
+            self._started = True
+        futures = [self._submit(self._launch_one) for _ in range(self.size)]
+        for future in futures:
+            future.add_done_callback(self._launched)
+        if wait:
+            try:
+                for future in futures:
+                    future.result()
+            except Exception:
+                self.close()
+                raise
+        return self
+
+    def _submit(self, fn: Callable, *args: object) -> Future:
+        return self._executor.submit(fn, *args)
+
+    def _launch_one(self) -> None:
+        with self._lock:
+            self._launching += 1
+        browser = self._factory()
+        try:
+            browser.launch()
+        except Exception as e:
+            browser.close(wait=False)
+            with self._lock:
+                self._launch_error = e
+                self._failures += 1
+            raise
+        finally:
+            with self._lock:
+                self._launching -= 1
+        with self._lock:
+            self._launch_error = None
+            self._failures = 0
+            closed = self._closed
+            if not closed:
+                self._uses[id(browser)] = 0
+        if closed:
+            browser.close(wait=False)
+            return
+        self._idle.put(browser)
+
+    def _launched(self, future: Future) -> None:
+        error = future.exception()
+        if error is None or self._closed:
+            return
+        logger.warning("Pooled browser launch failed: %s", error)
+        try:
+            self._submit(self._fill, _RETRY_DELAY)
+        except RuntimeError:
+            pass
+
+    def _fill(self, delay: float = 0.0) -> None:
+        """Launch one browser, retrying with backoff until it works or the pool closes."""
+        while not self._closing.wait(delay):
+            try:
+                self._launch_one()
+            except Exception as e:
+                delay = min(max(delay * 2, _RETRY_DELAY), _MAX_RETRY_DELAY)
+                logger.warning(
+                    "Pooled browser launch failed, retrying in %.1fs: %s", delay, e
+                )
+            else:
+                return
+
+    def acquire(self, timeout: float | None = None) -> Browser:
+        """Take an idle browser, waiting up to *timeout* seconds for one."""
+        if not self._started:
+            self.start(wait=False)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            if self._closed:
+                raise RuntimeError("BrowserPool is closed")
+            error = self._launch_error
+            if (
+                self._failures >= _FAILURES_TO_RAISE
+                and not self._uses
+                and not self._launching
+            ):
+                raise RuntimeError(
+                    f"BrowserPool cannot launch browsers: {error}"
+                ) from error
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise TimeoutError(f"No browser available within {timeout}s")
+            try:
+                browser = self._idle.get(
+                    timeout=_POLL if remaining is None else min(remaining, _POLL)
+                )
+            except queue.Empty:
+                continue
+            if browser.bridge.connected:
+                return browser
+            logger.warning("Pooled browser lost its extension connection")
+            self._retire(browser)
+
+    def release(self, browser: Browser) -> None:
+        """Return a leased browser; it is reset or replaced in the background."""
+        with self._lock:
+            uses = self._uses.get(id(browser), 0) + 1
+            self._uses[id(browser)] = uses
+            closed = self._closed
+        if closed:
+            self._uses.pop(id(browser), None)
+            browser.close(wait=False)
+        elif uses >= self.max_uses or self._over_memory(browser):
+            self._retire(browser)
+        else:
+            self._submit(self._recycle, browser)
+
+    @contextmanager
+    def lease(self, timeout: float | None = None) -> Iterator[Browser]:
+        browser = self.acquire(timeout)
+        try:
+            yield browser
+        finally:
+            self.release(browser)
+
+    def _over_memory(self, browser: Browser) -> bool:
+        if self.max_rss_mb is None:
+            return False
+        sample = browser.resources()
+        return sample is not None and sample.rss_mb > self.max_rss_mb
+
+    def _recycle(self, browser: Browser) -> None:
+        try:
+            browser.reset()
+        except Exception as e:
+            logger.warning("Pooled browser reset failed: %s", e)
+            self._replace(browser)
+            return
+        self._idle.put(browser)
+
+    def _retire(self, browser: Browser) -> None:
+        self._submit(self._replace, browser)
+
+    def _replace(self, browser: Browser) -> None:
+        self._uses.pop(id(browser), None)
+        try:
+            browser.close(wait=False)
+        except Exception as e:
+            logger.warning("Failed to close pooled browser: %s", e)
+        if not self._closed:
+            self._fill()
+
+    def close(self, timeout: float | None = 30.0) -> None:
+        """Close idle browsers; leased ones are closed when released.
+
+        Idle browsers are torn down together on the reaper; this waits up to
+        *timeout* seconds for them.
+        """
+        with self._lock:
+            self._closed = True
+        self._closing.set()
+        self._executor.shutdown(wait=True)
+        while True:
+            try:
+                browser = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._uses.pop(id(browser), None)
+            browser.close(wait=False)
+        if not get_reaper().drain(timeout):
+            logger.warning("Browser pool teardown still running after %ss", timeout)
+        logger.info("Browser pool closed")
+
+    def __enter__(self) -> BrowserPool:
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
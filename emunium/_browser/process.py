@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import NamedTuple
+
+_PROC = "/proc"
+
+
+def _children() -> dict[int, list[int]]:
+    tree: dict[int, list[int]] = {}
+    for entry in os.scandir(_PROC):
+        if not entry.name.isdigit():
+            continue
+        try:
+            with open(f"{_PROC}/{entry.name}/stat", encoding="ascii") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+        except (OSError, IndexError):
+            continue
+        tree.setdefault(int(fields[1]), []).append(int(entry.name))
+    return tree
+
+
+def process_tree(pid: int) -> list[int]:
+    """*pid* and all of its descendants, read from ``/proc`` (Linux only)."""
+    tree = _children()
+    found = [pid]
+    for parent in found:
+        found.extend(tree.get(parent, ()))
+    return found
+
+
+def process_state(pid: int) -> str | None:
+    """One-letter ``/proc`` state of *pid* (``"Z"`` for a zombie), or ``None``."""
+    try:
+        with open(f"{_PROC}/{pid}/stat", encoding="ascii") as f:
+            return f.read().rsplit(")", 1)[1].split()[0]
+    except (OSError, IndexError):
+        return None
+
+
+def _rss(pid: int, page: int) -> int:
+    with open(f"{_PROC}/{pid}/statm", encoding="ascii") as f:
+        return int(f.read().split()[1]) * page
+
+
+def _cpu_ticks(pid: int) -> int:
+    with open(f"{_PROC}/{pid}/stat", encoding="ascii") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    return int(fields[11]) + int(fields[12])
+
+
+class ResourceSample(NamedTuple):
+    timestamp: float
+    processes: int
+    rss: int
+    cpu_percent: float
+
+    @property
+    def rss_mb(self) -> float:
+        return self.rss / (1024 * 1024)
+
+
+class ProcessMonitor:
+    """CPU and resident memory of a whole process tree, sampled from ``/proc``.
+
+    ``cpu_percent`` is measured over the time since the previous sample (or
+    since the monitor was created) and is per core, so a tree saturating two
+    cores reports 200. :meth:`start` samples on a daemon thread and keeps the
+    latest and peak values. Linux only; see :attr:`available`.
+    """
+
+    available = os.path.isdir(_PROC)
+
+    def __init__(self, pid: int) -> None:
+        self.pid = pid
+        self._page = os.sysconf("SC_PAGE_SIZE") if self.available else 0
+        self._hz = os.sysconf("SC_CLK_TCK") if self.available else 100
+        self._lock = threading.Lock()
+        self._ticks: dict[int, int] = {}
+        self._last = time.monotonic()
+        self._latest: ResourceSample | None = None
+        self._peak_rss = 0
+        self._stop: threading.Event | None = None
+        if self.available:
+            self._ticks = self._read()[1]
+
+    @property
+    def latest(self) -> ResourceSample | None:
+        return self._latest
+
+    @property
+    def peak_rss(self) -> int:
+        return self._peak_rss
+
+    def _read(self) -> tuple[int, dict[int, int]]:
+        rss = 0
+        ticks: dict[int, int] = {}
+        for member in process_tree(self.pid):
+            try:
+                rss += _rss(member, self._page)
+                ticks[member] = _cpu_ticks(member)
+            except (OSError, IndexError, ValueError):
+                continue
+        return rss, ticks
+
+    def sample(self) -> ResourceSample | None:
+        if not self.available:
+            return None
+        with self._lock:
+            rss, ticks = self._read()
+            now = time.monotonic()
+            spent = sum(t - self._ticks.get(pid, 0) for pid, t in ticks.items())
+            elapsed = now - self._last
+            cpu = max(spent, 0) / self._hz / elapsed * 100 if elapsed > 0 else 0.0
+            self._ticks = ticks
+            self._last = now
+            sample = ResourceSample(time.time(), len(ticks), rss, cpu)
+            self._latest = sample
+            self._peak_rss = max(self._peak_rss, rss)
+        return sample
+
+    def start(self, interval: float = 1.0) -> ProcessMonitor:
+        """Sample every *interval* seconds on a background thread."""
+        if self._stop is None and self.available:
+            self._stop = threading.Event()
+            threading.Thread(
+                target=self._run,
+                args=(self._stop, interval),
+                daemon=True,
+                name="emun-monitor",
+            ).start()
+        return self
+
+    def _run(self, stop: threading.Event, interval: float) -> None:
+        while not stop.wait(interval):
+            self.sample()
+
+    def stop(self) -> None:
+        if self._stop is not None:
+            self._stop.set()
+            self._stop = None
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from pathlib import Path
+
+from emunium._browser.reaper import get_reaper
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+logger = logging.getLogger("emunium.browser")
+
+_MARKER = ".emunium_template"
+_SHM = "/dev/shm"
+# Per-run state that must never be shared between clones.
+_SKIP = frozenset(
+    {
+        _MARKER,
+        "emunium_extension",
+        "SingletonCookie",
+        "SingletonLock",
+        "SingletonSocket",
+        "lockfile",
+    }
+)
+_FICLONE = 0x40049409
+
+
+def _reflink(source: str, target: str) -> bool:
+    if fcntl is None:
+        return False
+    try:
+        with open(source, "rb") as src, open(target, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        return True
+    except OSError:
+        return False
+
+
+def _copy_file(source: str, target: str) -> None:
+    if not _reflink(source, target):
+        shutil.copy2(source, target)
+
+
+def discard_profile(path: str) -> None:
+    """Remove a profile directory without waiting for the delete.
+
+    The directory is renamed aside first, so its name is free at once, and
+    the tree is deleted by the reaper, which reports it if it survives.
+    """
+    doomed = f"{path}.discard-{uuid.uuid4().hex[:8]}"
+    try:
+        os.rename(path, doomed)
+    except OSError:
+        doomed = path
+    reaper = get_reaper()
+    reaper.submit(reaper.remove_tree, doomed)
+
+
+class ProfileTemplate:
+    """A seeded, warmed Chrome profile that sessions clone instead of building.
+
+    :meth:`build` seeds preferences and, with *warm*, runs Chrome on the
+    template once (optionally visiting *warm_urls*), so first-run work and
+    caches are already on disk. :meth:`clone` copies the tree with reflinks
+    where the filesystem supports them (Btrfs, XFS) and a plain copy
+    elsewhere; files are never hardlinked, because Chrome rewrites its
+    databases in place. With *tmpfs*, clones go to ``/dev/shm``.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        *,
+        warm: bool = True,
+        warm_urls: tuple[str, ...] = (),
+        tmpfs: bool = False,
+    ) -> None:
+        self.path = Path(path).resolve()
+        self.warm = warm
+        self.warm_urls = tuple(warm_urls)
+        self.tmpfs = tmpfs
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return (self.path / _MARKER).exists()
+
+    def build(self, *, force: bool = False) -> ProfileTemplate:
+        """Create the template unless it already exists for the current Chrome."""
+        from emunium._browser.launcher import (
+            BrowserSession,
+            _seed_profile,
+            close,
+            launch,
+        )
+        from emunium._browser.page import goto
+        from emunium.bridge import Bridge
+        from emunium.chrome_installer import ensure_chrome
+
+        with self._lock:
+            chrome_path = ensure_chrome()
+            marker = self.path / _MARKER
+            if not force and marker.exists():
+                try:
+                    info = json.loads(marker.read_text(encoding="utf-8"))
+                except (OSError, ValueError):
+                    info = {}
+                if info.get("chrome") == chrome_path:
+                    return self
+            shutil.rmtree(self.path, ignore_errors=True)
+            self.path.mkdir(parents=True)
+            _seed_profile(str(self.path))
+            if self.warm:
+                session = BrowserSession()
+                session.bridge = Bridge()
+                session.headless = True
+                session.user_data_dir = str(self.path)
+                launch(session)
+                try:
+                    for url in self.warm_urls:
+                        goto(session.bridge, url)
+                finally:
+                    close(session)
+                _seed_profile(str(self.path))
+            marker.write_text(json.dumps({"chrome": chrome_path}), encoding="utf-8")
+            logger.info("Built profile template: %s", self.path)
+        return self
+
+    def clone(self, root: str | None = None) -> str:
+        """Copy the template into a new temp directory and return its path."""
+        if not self.ready:
+            self.build()
+        if root is None and self.tmpfs and os.path.isdir(_SHM):
+            root = _SHM
+        target = tempfile.mkdtemp(prefix="emun_profile_", dir=root)
+        source = str(self.path)
+        for dirpath, dirnames, filenames in os.walk(source):
+            rel = os.path.relpath(dirpath, source)
+            dest = target if rel == "." else os.path.join(target, rel)
+            dirnames[:] = [d for d in dirnames if d not in _SKIP]
+            for name in dirnames:
+                os.mkdir(os.path.join(dest, name))
+            for name in filenames:
+                if name in _SKIP:
+                    continue
+                src = os.path.join(dirpath, name)
+                if os.path.islink(src):
+                    continue
+                _copy_file(src, os.path.join(dest, name))
+        return target
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import logging
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable, NamedTuple
+
+logger = logging.getLogger("emunium.browser")
+
+
+class Leak(NamedTuple):
+    kind: str
+    detail: str
+
+
+class Reaper:
+    """Bounded background teardown for browsers and profiles.
+
+    Jobs run on at most *max_workers* threads, so closing many browsers at
+    once cannot stampede the host. Anything a job fails to clean up, such
+    as a process that survives SIGKILL or a profile that cannot be deleted,
+    is logged and kept in :attr:`leaks`. Pending jobs still finish at
+    interpreter exit.
+    """
+
+    def __init__(self, max_workers: int = 4) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="emun-reaper"
+        )
+        self._lock = threading.Lock()
+        self._pending: set[Future] = set()
+        self._leaks: list[Leak] = []
+
+    @property
+    def leaks(self) -> list[Leak]:
+        with self._lock:
+            return list(self._leaks)
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def leak(self, kind: str, detail: str) -> None:
+        logger.warning("Teardown leak (%s): %s", kind, detail)
+        with self._lock:
+            self._leaks.append(Leak(kind, detail))
+
+    def submit(self, fn: Callable, *args: object) -> Future:
+        future = self._executor.submit(self._run, fn, *args)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._done)
+        return future
+
+    def _run(self, fn: Callable, *args: object) -> None:
+        try:
+            fn(*args)
+        except Exception as e:
+            self.leak("error", f"{getattr(fn, '__name__', fn)}: {e}")
+
+    def _done(self, future: Future) -> None:
+        with self._lock:
+            self._pending.discard(future)
+
+    def drain(self, timeout: float | None = None) -> bool:
+        """Wait for queued teardown; ``False`` if some is still running.
+
+        Jobs queued by other jobs (a profile delete after its browser has
+        exited) are waited for as well.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                pending = list(self._pending)
+            if not pending:
+                return True
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            wait(pending, timeout=remaining)
+
+    def remove_tree(self, path: str) -> None:
+        shutil.rmtree(path, ignore_errors=True)
+        if os.path.exists(path):
+            self.leak("profile", f"could not delete {path}")
+
+
+_reaper: Reaper | None = None
+_reaper_lock = threading.Lock()
+
+
+def get_reaper() -> Reaper:
+    global _reaper
+    with _reaper_lock:
+        if _reaper is None:
+            _reaper = Reaper()
+        return _reaper
+
+
+def set_reaper(reaper: Reaper | int) -> Reaper:
+    """Replace the process-wide reaper, or give the worker count for a new one.
+
+    Jobs already queued on the previous reaper still run to completion.
+    """
+    global _reaper
+    if isinstance(reaper, int):
+        reaper = Reaper(max_workers=reaper)
+    with _reaper_lock:
+        _reaper = reaper
+    return reaper
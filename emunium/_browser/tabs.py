@@ -3,8 +3,15 @@ from __future__ import annotations
 from emunium.bridge import Bridge
 
 
-def new_tab(bridge: Bridge, url: str = "about:blank") -> dict:
-    return bridge.create_tab(url)
+def new_tab(bridge: Bridge, url: str = "about:blank", *, active: bool = True) -> dict:
+    result = bridge.create_tab(url, active)
+    if result and result.get("error"):
+        raise RuntimeError(f"Failed to open tab: {result['error']}")
+    return result or {}
+
+
+def activate(bridge: Bridge) -> dict:
+    return bridge.activate_tab()
 
 
 def close_tab(bridge: Bridge, tab_id: int | None = None) -> dict:
@@ -13,3 +20,10 @@ def close_tab(bridge: Bridge, tab_id: int | None = None) -> dict:
 
 def tab_info(bridge: Bridge) -> dict:
     return bridge.get_tab_info()
+
+
+def reset(bridge: Bridge, timeout: float = 30.0) -> dict:
+    result = bridge.reset_session(timeout)
+    if result and result.get("error"):
+        raise RuntimeError(f"Session reset failed: {result['error']}")
+    return result or {}
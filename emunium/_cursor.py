@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import math
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+import pyautogui
+
+from emunium._input.backend import InputBackend, get_backend
+from emunium._timing import get_policy
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _ease_out_quad(t: object) -> object:
+    return 1 - (1 - t) ** 2
+
+
+def _ease_out_cubic(t: object) -> object:
+    return 1 - (1 - t) ** 3
+
+
+def _ease_out_quart(t: object) -> object:
+    return 1 - (1 - t) ** 4
+
+
+def _ease_out_sine(t: object) -> object:
+    return np.sin(t * np.pi / 2)
+
+
+def _ease_in_out_sine(t: object) -> object:
+    return -(np.cos(np.pi * t) - 1) / 2
+
+
+def _ease_in_out_cubic(t: object) -> object:
+    return np.where(t < 0.5, 4 * t**3, 1 - (-2 * t + 2) ** 3 / 2)
+
+
+def _ease_in_out_quart(t: object) -> object:
+    return np.where(t < 0.5, 8 * t**4, 1 - (-2 * t + 2) ** 4 / 2)
+
+
+def _ease_out_circ(t: object) -> object:
+    return np.sqrt(1 - (t - 1) ** 2)
+
+
+def _linear(t: object) -> object:
+    return t
+
+
+EASINGS = (
+    _linear,
+    _ease_out_quad,
+    _ease_out_cubic,
+    _ease_out_quart,
+    _ease_out_sine,
+    _ease_in_out_sine,
+    _ease_in_out_cubic,
+    _ease_in_out_quart,
+    _ease_out_circ,
+)
+
+_MIN_CORRECTION = 0.15
+_MAX_PREPARED = 2
+
+_KNOT_WEIGHTS = (0.15, 0.36, 0.17, 0.12, 0.08, 0.04, 0.03, 0.02, 0.015, 0.005)
+_KNOT_PROBS = tuple(w / sum(_KNOT_WEIGHTS) for w in _KNOT_WEIGHTS)
+
+
+class TrajectoryGenerator:
+    """Vectorized human-like mouse paths: random-knot Bezier, jitter and easing.
+
+    Follows the same parameter distributions as HumanCursor, but evaluates the
+    Bernstein basis, distortion and easing as NumPy array operations. Without
+    an explicit *rng*, draws come from the active timing policy's generator.
+    A *seed* from :meth:`seed` fixes one path, so it can be generated on
+    another thread without touching the shared generator.
+    """
+
+    def __init__(self, rng: object | None = None) -> None:
+        if np is None:
+            raise ImportError("numpy is required for TrajectoryGenerator")
+        self.rng = rng
+        self._screen: tuple[int, int] | None = None
+
+    def _screen_size(self) -> tuple[int, int]:
+        if self._screen is None:
+            width, height = pyautogui.size()
+            self._screen = (int(width), int(height))
+        return self._screen
+
+    def _in_safe_zone(self, point: tuple[int, int]) -> bool:
+        width, height = self._screen_size()
+        return (
+            width * 0.15 <= point[0] <= width * 0.85
+            and height * 0.15 <= point[1] <= height * 0.85
+        )
+
+    def seed(self) -> int:
+        """Draw a seed for one path from *rng* or the timing policy."""
+        rng = self.rng if self.rng is not None else get_policy().np_rng
+        return int(rng.integers(2**63))
+
+    def generate(
+        self,
+        start: tuple[int, int],
+        end: tuple[int, int],
+        seed: int | None = None,
+    ) -> object:
+        """Return an ``(n, 2)`` int array of screen points from *start* to *end*."""
+        if seed is not None:
+            rng = np.random.default_rng(seed)
+        elif self.rng is not None:
+            rng = self.rng
+        else:
+            rng = get_policy().np_rng
+        start_arr = np.asarray(start, dtype=float)
+        end_arr = np.asarray(end, dtype=float)
+
+        if self._in_safe_zone(start) and self._in_safe_zone(end):
+            bound = rng.integers(20, 100, size=2)
+            knots_count = int(rng.choice(len(_KNOT_WEIGHTS), p=_KNOT_PROBS)) + 1
+        else:
+            bound = np.zeros(2, dtype=int)
+            knots_count = 1
+
+        low = np.minimum(start_arr, end_arr) - bound
+        high = np.maximum(start_arr, end_arr) + bound
+        knots = rng.uniform(low, high, size=(knots_count, 2))
+        control = np.vstack([start_arr, knots, end_arr])
+
+        span = int(max(np.abs(end_arr - start_arr).max(), 2))
+        t = np.linspace(0.0, 1.0, span)[:, None]
+        degree = len(control) - 1
+        i = np.arange(degree + 1)
+        coeffs = np.array([math.comb(degree, k) for k in range(degree + 1)], float)
+        curve = (coeffs * t**i * (1 - t) ** (degree - i)) @ control
+
+        if span > 2:
+            frequency = rng.uniform(0.25, 0.7)
+            mask = rng.random(span - 2) < frequency
+            noise = rng.normal(rng.uniform(0.8, 1.1), rng.uniform(0.85, 1.1), span - 2)
+            curve[1:-1, 1] += noise * mask
+
+        target_points = max(int(np.hypot(*(end_arr - start_arr))), 2)
+        ease = EASINGS[int(rng.integers(len(EASINGS)))]
+        steps = np.clip(ease(np.linspace(0.0, 1.0, target_points)), 0.0, 1.0)
+        points = np.rint(curve[(steps * (span - 1)).astype(int)]).astype(int)
+        points[-1] = end_arr.astype(int)
+
+        keep = np.ones(len(points), dtype=bool)
+        keep[1:] = np.any(points[1:] != points[:-1], axis=1)
+        return points[keep]
+
+
+def _as_point(point: tuple[float, float] | list[float]) -> tuple[int, int]:
+    return int(point[0]), int(point[1])
+
+
+class CursorEngine:
+    """Long-lived human cursor with a drop-in ``SystemCursor`` interface.
+
+    Trajectories can be planned ahead on a background thread with
+    :meth:`prepare`; :meth:`move_to` reuses the plan when the start and target
+    still match, so the first mouse event follows the request immediately.
+    Events go through the process-wide input backend unless one is given.
+    """
+
+    def __init__(
+        self,
+        generator: TrajectoryGenerator | None = None,
+        backend: InputBackend | None = None,
+    ) -> None:
+        self.generator = generator or TrajectoryGenerator()
+        self._backend = backend
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="emun-cursor"
+        )
+        self._prepared: dict[tuple[tuple[int, int], tuple[int, int]], Future] = {}
+
+    @property
+    def backend(self) -> InputBackend:
+        return self._backend or get_backend()
+
+    def _position(self) -> tuple[int, int]:
+        return self.backend.position()
+
+    def prepare(
+        self, point: tuple[int, int], start: tuple[int, int] | None = None
+    ) -> None:
+        origin = start if start is not None else self._position()
+        key = (tuple(origin), (int(point[0]), int(point[1])))
+        if key not in self._prepared:
+            while len(self._prepared) >= _MAX_PREPARED:
+                self._prepared.pop(next(iter(self._prepared)))
+            self._prepared[key] = self._executor.submit(
+                self.generator.generate, key[0], key[1], self.generator.seed()
+            )
+
+    def _plan(self, origin: tuple[int, int], target: tuple[int, int]) -> object:
+        future = self._prepared.pop((origin, target), None)
+        if future is not None:
+            return future.result()
+        return self.generator.generate(origin, target, self.generator.seed())
+
+    def move_to(
+        self,
+        point: tuple[int, int] | list[int],
+        duration: float | None = None,
+        *,
+        target: Future | None = None,
+    ) -> tuple[int, int]:
+        """Move along a human path to *point* and return the final position.
+
+        If *target* is given, it is a future for the fresh destination. The
+        cursor heads for *point* (the last known position) meanwhile and bends
+        toward the fresh destination as soon as the future completes.
+        """
+        goal = (int(point[0]), int(point[1]))
+        origin = self._position()
+        if origin == goal and target is None:
+            return goal
+        points = self._plan(origin, goal).tolist()
+        policy = get_policy()
+        if duration is None:
+            duration = policy.delay(0.5, 2.0)
+        interval = duration / max(len(points), 1)
+        backend = self.backend
+        if target is None:
+            with policy.waiting():
+                backend.play_path(points, interval)
+            backend.move(*goal)
+            return goal
+        started = time.perf_counter()
+        index = 0
+        while index < len(points):
+            if target is not None and target.done():
+                fresh = _as_point(target.result())
+                target = None
+                if fresh != goal:
+                    current = tuple(points[index - 1]) if index else origin
+                    remaining = duration - (time.perf_counter() - started)
+                    goal = fresh
+                    points = self.generator.generate(
+                        current, goal, self.generator.seed()
+                    ).tolist()
+                    interval = max(remaining, policy.delay(_MIN_CORRECTION)) / max(
+                        len(points), 1
+                    )
+                    started = time.perf_counter()
+                    duration = interval * len(points)
+                    index = 0
+                    continue
+            x, y = points[index]
+            backend.move(x, y)
+            index += 1
+            delay = started + index * interval - time.perf_counter()
+            if delay > 0:
+                policy.wait(delay)
+        if target is not None:
+            fresh = _as_point(target.result())
+            if fresh != goal:
+                return self.move_to(fresh, duration=policy.delay(_MIN_CORRECTION))
+        backend.move(*goal)
+        return goal
+
+    def click_on(
+        self,
+        point: tuple[int, int] | list[int],
+        clicks: int = 1,
+        *,
+        target: Future | None = None,
+    ) -> None:
+        self.move_to(point, target=target)
+        backend = self.backend
+        for _ in range(clicks):
+            backend.mouse_down()
+            backend.mouse_up()
+            get_policy().pause(0.170, 0.280)
+
+    def drag_and_drop(
+        self,
+        from_point: tuple[int, int] | list[int],
+        to_point: tuple[int, int] | list[int],
+        *,
+        from_target: Future | None = None,
+        to_target: Callable[[], Future] | None = None,
+    ) -> None:
+        """Drag between two points.
+
+        *to_target* is called once the button is down, so a destination lookup
+        that disturbs the page (e.g. scrolling) cannot invalidate the source.
+        """
+        self.move_to(from_point, target=from_target)
+        self.backend.mouse_down()
+        self.move_to(to_point, target=to_target() if to_target else None)
+        self.backend.mouse_up()
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-import random
-import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
 
 import pyautogui
 import pyperclip
 
+from emunium._cursor import CursorEngine, np
+from emunium._input.backend import get_backend
 from emunium._standalone.config import ClickType
+from emunium._timing import get_policy
+from emunium._typing_engine import replay
 
 try:
     from humancursor import SystemCursor
@@ -20,6 +24,86 @@ except ImportError:
 
 
 class ElementInteractor:
+    def __init__(self) -> None:
+        self._cursor: object | None = None
+        self._resolver: ThreadPoolExecutor | None = None
+
+    @property
+    def cursor(self) -> object | None:
+        """Long-lived human cursor, created on first use.
+
+        Uses the vectorized :class:`CursorEngine` when NumPy is available and
+        falls back to a single shared HumanCursor ``SystemCursor`` otherwise.
+        """
+        if self._cursor is None:
+            if np is not None:
+                self._cursor = CursorEngine()
+            elif SystemCursor is not None:
+                self._cursor = SystemCursor()
+        return self._cursor
+
+    def prepare_move(
+        self, x: int, y: int, start: tuple[int, int] | None = None
+    ) -> None:
+        """Plan the trajectory to ``(x, y)`` in the background, if supported.
+
+        *start* defaults to the current cursor position.
+        """
+        cursor = self.cursor
+        if isinstance(cursor, CursorEngine):
+            cursor.prepare((x, y), start)
+
+    def _submit(self, resolve: Callable[[], tuple[int, int]]) -> object:
+        if self._resolver is None:
+            self._resolver = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="emun-resolve"
+            )
+        return self._resolver.submit(resolve)
+
+    def click_pipelined(
+        self,
+        guess: tuple[int, int],
+        resolve: Callable[[], tuple[int, int]],
+        *,
+        click_type: ClickType = ClickType.LEFT,
+    ) -> tuple[int, int]:
+        """Start moving toward *guess* while *resolve* fetches fresh coordinates.
+
+        The path is corrected in flight once *resolve* returns. Without the
+        vectorized cursor engine this degrades to resolve-then-click.
+        """
+        cursor = self.cursor
+        if not isinstance(cursor, CursorEngine):
+            x, y = resolve()
+            self.click(x, y, click_type=click_type)
+            return x, y
+        future = self._submit(resolve)
+        cursor.move_to(guess, target=future)
+        x, y = future.result()
+        self.click(x, y, click_type=click_type)
+        return x, y
+
+    def drag_pipelined(
+        self,
+        source_guess: tuple[int, int],
+        resolve_source: Callable[[], tuple[int, int]],
+        target_guess: tuple[int, int],
+        resolve_target: Callable[[], tuple[int, int]],
+    ) -> None:
+        """Drag with each endpoint lookup overlapped with the mouse travel to it."""
+        cursor = self.cursor
+        if not isinstance(cursor, CursorEngine):
+            start = resolve_source()
+            end = resolve_target()
+            self.drag(start, end)
+            return
+        cursor.drag_and_drop(
+            source_guess,
+            target_guess,
+            from_target=self._submit(resolve_source),
+            to_target=lambda: self._submit(resolve_target),
+        )
+
     def screen_point(
         self,
         screen_x: float,
@@ -28,13 +112,15 @@ class ElementInteractor:
         offset_x: float | None = None,
         offset_y: float | None = None,
     ) -> tuple[int, int]:
-        x_offset = offset_x if offset_x is not None else random.uniform(0.0, 1.5)
-        y_offset = offset_y if offset_y is not None else random.uniform(0.0, 1.5)
+        policy = get_policy()
+        x_offset = offset_x if offset_x is not None else policy.uniform(0.0, 1.5)
+        y_offset = offset_y if offset_y is not None else policy.uniform(0.0, 1.5)
         return round(screen_x + x_offset), round(screen_y + y_offset)
 
     def move_cursor(self, x: int, y: int, *, human: bool = True) -> None:
-        if human and SystemCursor is not None:
-            SystemCursor().move_to([x, y])
+        cursor = self.cursor if human else None
+        if cursor is not None:
+            cursor.move_to([x, y])
             return
         pyautogui.moveTo(x=x, y=y)
 
@@ -61,7 +147,11 @@ class ElementInteractor:
         *,
         characters_per_minute: int = 280,
         offset: int = 20,
+        paste_threshold: int | None = None,
     ) -> None:
+        if paste_threshold is not None and len(text) > paste_threshold:
+            self._paste_text(text)
+            return
         if characters_per_minute > 0:
             self._type_with_rhythm(
                 text,
@@ -81,23 +171,25 @@ class ElementInteractor:
         *,
         human: bool = True,
     ) -> None:
-        if human and SystemCursor is not None:
-            SystemCursor().drag_and_drop(start, end)
+        cursor = self.cursor if human else None
+        if cursor is not None:
+            cursor.drag_and_drop(start, end)
             return
         pyautogui.moveTo(*start)
         pyautogui.drag(end[0] - start[0], end[1] - start[1], duration=0.5)
 
     def _click_left(self, x: int, y: int, *, human: bool) -> None:
-        if human and SystemCursor is not None:
-            SystemCursor().click_on([x, y])
+        cursor = self.cursor if human else None
+        if cursor is not None:
+            cursor.click_on([x, y])
             return
         pyautogui.click(x=x, y=y)
 
     def _double_click(self, x: int, y: int, *, human: bool) -> None:
-        if human and SystemCursor is not None:
-            cursor = SystemCursor()
+        cursor = self.cursor if human else None
+        if cursor is not None:
             cursor.click_on([x, y])
-            time.sleep(0.08)
+            get_policy().pause(0.08)
             cursor.click_on([x, y])
             return
         pyautogui.doubleClick(x=x, y=y)
@@ -109,14 +201,26 @@ class ElementInteractor:
         characters_per_minute: int,
         offset: int,
     ) -> None:
-        delay = 60.0 / characters_per_minute
-        for character in text:
-            jitter = delay + random.uniform(-offset, offset) / 1000
-            if _keyboard is not None:
-                _keyboard.write(character)
-            else:
-                pyautogui.typewrite(character, interval=0)
-            time.sleep(max(0, jitter))
+        policy = get_policy()
+        timeline = policy.timeline(
+            text,
+            characters_per_minute=characters_per_minute,
+            offset=offset,
+        )
+        backend = get_backend()
+        if backend.can_type(text):
+            with policy.waiting():
+                backend.play_timeline(timeline)
+            return
+        replay(timeline, self._emit_keys, sleep=policy.wait)
+
+    def _emit_keys(self, chunk: str) -> None:
+        if _keyboard is not None:
+            _keyboard.write(chunk)
+        elif self._is_ascii_text(chunk):
+            pyautogui.typewrite(chunk, interval=0)
+        else:
+            self._paste_text(chunk)
 
     @staticmethod
     def _is_ascii_text(text: str) -> bool:
@@ -144,7 +248,7 @@ class ElementInteractor:
             should_restore = False
         pyperclip.copy(text)
         pyautogui.hotkey("ctrl", "v")
-        time.sleep(0.05)
+        get_policy().pause(0.05)
         if should_restore:
             try:
                 pyperclip.copy(previous_clipboard)
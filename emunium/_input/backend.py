@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import time
+from typing import Sequence
+
+import pyautogui
+
+from emunium._typing_engine import Timeline
+
+
+class InputBackend:
+    """OS input sink used by the cursor engine and element interactions.
+
+    Backends must implement single-event primitives. Batched backends also
+    override :meth:`play_path` and :meth:`play_timeline` to queue a whole
+    trajectory or keystroke timeline and flush it at once.
+    """
+
+    name = "base"
+
+    def position(self) -> tuple[int, int]:
+        raise NotImplementedError
+
+    def move(self, x: int, y: int) -> None:
+        raise NotImplementedError
+
+    def mouse_down(self, button: str = "left") -> None:
+        raise NotImplementedError
+
+    def mouse_up(self, button: str = "left") -> None:
+        raise NotImplementedError
+
+    def play_path(self, points: Sequence[Sequence[int]], interval: float) -> None:
+        """Move through *points*, one every *interval* seconds."""
+        started = time.perf_counter()
+        for index, (x, y) in enumerate(points, 1):
+            self.move(x, y)
+            delay = started + index * interval - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+    def can_type(self, text: str) -> bool:
+        """Whether :meth:`play_timeline` can deliver every character of *text*."""
+        return False
+
+    def play_timeline(self, timeline: Timeline) -> None:
+        raise NotImplementedError(f"{self.name} backend cannot replay keystrokes")
+
+    def close(self) -> None:
+        pass
+
+
+class PyAutoGUIBackend(InputBackend):
+    """One ``pyautogui`` call per event; works on every supported platform."""
+
+    name = "pyautogui"
+
+    def position(self) -> tuple[int, int]:
+        x, y = pyautogui.position()
+        return int(x), int(y)
+
+    def move(self, x: int, y: int) -> None:
+        pyautogui.moveTo(x, y, _pause=False)
+
+    def mouse_down(self, button: str = "left") -> None:
+        pyautogui.mouseDown(button=button, _pause=False)
+
+    def mouse_up(self, button: str = "left") -> None:
+        pyautogui.mouseUp(button=button, _pause=False)
+
+
+def _xtest_backend() -> InputBackend:
+    from emunium._input.xtest import XTestBackend
+
+    return XTestBackend()
+
+
+_BACKENDS = {"pyautogui": PyAutoGUIBackend, "xtest": _xtest_backend}
+_current: InputBackend | None = None
+
+
+def get_backend() -> InputBackend:
+    global _current
+    if _current is None:
+        _current = PyAutoGUIBackend()
+    return _current
+
+
+def set_backend(backend: str | InputBackend) -> InputBackend:
+    """Select the process-wide input backend by name or instance."""
+    global _current
+    if isinstance(backend, str):
+        if backend not in _BACKENDS:
+            raise ValueError(
+                f"Unknown input backend {backend!r}; expected one of {sorted(_BACKENDS)}"
+            )
+        backend = _BACKENDS[backend]()
+    if _current is not None and _current is not backend:
+        _current.close()
+    _current = backend
+    return backend
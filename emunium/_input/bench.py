@@ -0,0 +1,127 @@
+"""Check and benchmark the input backends on the current X display.
+
+Run under Xvfb (needs the ``xtest`` extra)::
+
+    xvfb-run -s "-screen 0 1920x1080x24" python -m emunium._input.bench
+
+Each backend plays the same straight mouse path. The pointer must end on the
+last point, and the X server's own ``MotionNotify`` timestamps give the
+delivered rate and how far each step strays from the requested interval.
+"""
+
+from __future__ import annotations
+
+import statistics
+import threading
+import time
+from typing import Sequence
+
+from Xlib import X
+from Xlib import display as xdisplay
+
+from emunium._input.backend import InputBackend, PyAutoGUIBackend
+from emunium._input.xtest import XTestBackend
+
+
+class _MotionRecorder:
+    """Server timestamps (ms) of pointer motion on the root window."""
+
+    def __init__(self) -> None:
+        self._display = xdisplay.Display()
+        self._display.screen().root.change_attributes(event_mask=X.PointerMotionMask)
+        self._display.sync()
+        self.times: list[int] = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            while self._display.pending_events():
+                event = self._display.next_event()
+                if event.type == X.MotionNotify:
+                    self.times.append(event.time)
+            time.sleep(0.001)
+
+    def collect(self, count: int, timeout: float = 5.0) -> list[int]:
+        deadline = time.monotonic() + timeout
+        while len(self.times) < count and time.monotonic() < deadline:
+            time.sleep(0.005)
+        times, self.times = self.times, []
+        return times
+
+    def close(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        self._display.close()
+
+
+def _path(count: int) -> list[tuple[int, int]]:
+    return [(100 + i % 800, 100 + i // 800 * 10) for i in range(count)]
+
+
+def measure(
+    backend: InputBackend,
+    recorder: _MotionRecorder,
+    points: Sequence[tuple[int, int]],
+    interval: float,
+) -> dict[str, float]:
+    backend.move(50, 50)
+    recorder.collect(1)
+    started = time.perf_counter()
+    backend.play_path(points, interval)
+    wall = time.perf_counter() - started
+    times = recorder.collect(len(points))
+    if backend.position() != tuple(points[-1]):
+        raise RuntimeError(f"{backend.name}: pointer did not end on the last point")
+    steps = [b - a for a, b in zip(times, times[1:])]
+    error = sorted(abs(step - interval * 1000) for step in steps) or [0.0]
+    return {
+        "events": len(times),
+        "wall_s": wall,
+        "rate": len(times) / wall if wall else 0.0,
+        "step_ms": statistics.mean(steps) if steps else 0.0,
+        "p95_err_ms": error[int(len(error) * 0.95) - 1 if len(error) > 1 else 0],
+        "max_err_ms": error[-1],
+    }
+
+
+def _spin(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def main() -> None:
+    recorder = _MotionRecorder()
+    backends = (PyAutoGUIBackend(), XTestBackend())
+    runs = (
+        ("paced 4 ms", _path(500), 0.004, False),
+        ("paced 4 ms, busy thread", _path(500), 0.004, True),
+        ("unpaced", _path(5000), 0.0, False),
+    )
+    backends[1].move(50, 50)  # off pyautogui's fail-safe corner
+    try:
+        for label, points, interval, busy in runs:
+            print(f"{label}: {len(points)} points")
+            stop = threading.Event()
+            if busy:
+                # Another Python thread holding the GIL, like the bridge or
+                # a background cursor plan in a real session.
+                threading.Thread(target=_spin, args=(stop,), daemon=True).start()
+            for backend in backends:
+                result = measure(backend, recorder, points, interval)
+                print(
+                    f"  {backend.name:<9} {result['events']:>5} events "
+                    f"{result['wall_s']:7.3f}s {result['rate']:9.0f}/s "
+                    f"step {result['step_ms']:5.2f} ms "
+                    f"p95 err {result['p95_err_ms']:5.1f} ms "
+                    f"max err {result['max_err_ms']:5.1f} ms"
+                )
+            stop.set()
+    finally:
+        backends[1].close()
+        recorder.close()
+
+
+if __name__ == "__main__":
+    main()
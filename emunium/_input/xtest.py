@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import time
+from typing import Sequence
+
+from emunium._input.backend import InputBackend
+from emunium._typing_engine import Timeline
+
+try:
+    from Xlib import X, XK
+    from Xlib import display as xdisplay
+    from Xlib.ext import xtest
+except ImportError:
+    xdisplay = None
+
+_BUTTONS = {"left": 1, "middle": 2, "right": 3}
+# Playback queued per flush before re-syncing to the client clock.
+_CHUNK_MS = 100
+
+
+def _keysym(character: str) -> int:
+    if character == "\n":
+        return XK.XK_Return
+    if character == "\t":
+        return XK.XK_Tab
+    codepoint = ord(character)
+    if 0x20 <= codepoint <= 0x7E or 0xA0 <= codepoint <= 0xFF:
+        return codepoint
+    return 0x01000000 | codepoint
+
+
+class _Pacer:
+    """XTest delays for events due at given offsets (ms) from the start.
+
+    The server waits ``time`` ms after the previous event, so its timer
+    overshoot adds up over a long batch. Every ``_CHUNK_MS`` of playback the
+    queue is flushed and waited for, and the next delay absorbs the lag.
+    """
+
+    def __init__(self, display: object) -> None:
+        self._display = display
+        self._started = time.perf_counter()
+        self._clock = 0.0
+        self._flushed = 0
+
+    def delay(self, due: int) -> int:
+        if due - self._flushed >= _CHUNK_MS:
+            self._display.sync()
+            self._clock = (time.perf_counter() - self._started) * 1000
+            self._flushed = due
+        wait = max(round(due - self._clock), 0)
+        self._clock += wait
+        return wait
+
+
+class XTestBackend(InputBackend):
+    """Batched X11 input through the XTest extension (Xorg, Xvfb).
+
+    Whole trajectories and keystroke timelines are queued as ``FakeInput``
+    requests whose ``time`` field is the delay after the previous event, and
+    flushed in chunks of about 100 ms. The X server paces them itself, so
+    there is no Python overhead or scheduler jitter between events, and the
+    lag its timer adds is taken back at each chunk; the call returns once the
+    server has played the last one.
+    """
+
+    name = "xtest"
+
+    def __init__(self, display: str | None = None) -> None:
+        if xdisplay is None:
+            raise ImportError(
+                "python-xlib is required for the XTest backend: "
+                "pip install emunium[xtest]"
+            )
+        self._display = xdisplay.Display(display)
+        if not self._display.has_extension("XTEST"):
+            self._display.close()
+            raise RuntimeError("X server does not support the XTEST extension")
+        self._root = self._display.screen().root
+        self._shift = self._display.keysym_to_keycode(XK.XK_Shift_L)
+        self._keys: dict[str, tuple[int, bool] | None] = {}
+
+    def position(self) -> tuple[int, int]:
+        pointer = self._root.query_pointer()
+        return int(pointer.root_x), int(pointer.root_y)
+
+    def move(self, x: int, y: int) -> None:
+        xtest.fake_input(self._display, X.MotionNotify, x=int(x), y=int(y))
+        self._display.sync()
+
+    def mouse_down(self, button: str = "left") -> None:
+        xtest.fake_input(self._display, X.ButtonPress, _BUTTONS[button])
+        self._display.sync()
+
+    def mouse_up(self, button: str = "left") -> None:
+        xtest.fake_input(self._display, X.ButtonRelease, _BUTTONS[button])
+        self._display.sync()
+
+    def play_path(self, points: Sequence[Sequence[int]], interval: float) -> None:
+        step = interval * 1000
+        pacer = _Pacer(self._display)
+        for index, (x, y) in enumerate(points):
+            delay = pacer.delay(round(index * step))
+            xtest.fake_input(
+                self._display, X.MotionNotify, time=delay, x=int(x), y=int(y)
+            )
+        self._display.sync()
+
+    def _keystroke(self, character: str) -> tuple[int, bool] | None:
+        if character not in self._keys:
+            stroke = None
+            for keycode, index in self._display.keysym_to_keycodes(_keysym(character)):
+                if index in (0, 1):
+                    stroke = (keycode, index == 1)
+                    break
+            self._keys[character] = stroke
+        return self._keys[character]
+
+    def can_type(self, text: str) -> bool:
+        return all(self._keystroke(character) is not None for character in text)
+
+    def play_timeline(self, timeline: Timeline) -> None:
+        pacer = _Pacer(self._display)
+
+        def fake(event_type: int, keycode: int, due: int) -> None:
+            xtest.fake_input(self._display, event_type, keycode, time=pacer.delay(due))
+
+        for due_seconds, chunk in timeline:
+            due = round(due_seconds * 1000)
+            for character in chunk:
+                keycode, shifted = self._keystroke(character)
+                if shifted:
+                    fake(X.KeyPress, self._shift, due)
+                fake(X.KeyPress, keycode, due)
+                fake(X.KeyRelease, keycode, due)
+                if shifted:
+                    fake(X.KeyRelease, self._shift, due)
+        self._display.sync()
+
+    def close(self) -> None:
+        self._display.close()
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, Union
+
+Source = Union[str, bytes, "os.PathLike[str]"]
+
+
+def read_source(path: str | os.PathLike[str], encoding: str = "utf-8") -> str:
+    """Read an HTML file as text, replacing undecodable bytes."""
+    with open(path, encoding=encoding, errors="replace", newline="") as fh:
+        return fh.read()
+
+
+def _to_payload(source: Source) -> tuple[str, str]:
+    if isinstance(source, os.PathLike):
+        return "path", os.fspath(source)
+    if isinstance(source, bytes):
+        return "html", source.decode("utf-8", errors="replace")
+    return "html", source
+
+
+def _load(kind: str, value: str, encoding: str) -> str:
+    if kind == "path":
+        return read_source(value, encoding)
+    return value
+
+
+def _extract_chunk(
+    chunk: list[tuple[str, str]], schema: object, encoding: str
+) -> list[dict]:
+    from emunium.locator import PageParser
+
+    return [
+        PageParser(_load(kind, value, encoding)).extract(schema)
+        for kind, value in chunk
+    ]
+
+
+def _chunks(
+    sources: Iterable[Source], chunksize: int
+) -> Iterator[list[tuple[str, str]]]:
+    it = iter(sources)
+    while True:
+        chunk = [_to_payload(s) for s in islice(it, chunksize)]
+        if not chunk:
+            return
+        yield chunk
+
+
+def extract_many(
+    sources: Iterable[Source],
+    schema: object,
+    *,
+    workers: int | None = None,
+    chunksize: int = 16,
+    max_pending: int | None = None,
+    encoding: str = "utf-8",
+) -> Iterator[dict]:
+    """Run ``PageParser.extract`` over *sources* and yield results in input order.
+
+    ``str``/``bytes`` items are HTML text; ``os.PathLike`` items are files that
+    worker processes read themselves, so only paths cross the pool. Sources are consumed
+    lazily and at most *max_pending* chunks are in flight, so memory stays
+    bounded regardless of how many pages are fed in.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be >= 1")
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+
+    if workers <= 1:
+        for chunk in _chunks(sources, chunksize):
+            yield from _extract_chunk(chunk, schema, encoding)
+        return
+
+    limit = max_pending if max_pending is not None else workers * 2
+    pending: deque[Future] = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        try:
+            for chunk in _chunks(sources, chunksize):
+                pending.append(pool.submit(_extract_chunk, chunk, schema, encoding))
+                if len(pending) >= limit:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            for fut in pending:
+                fut.cancel()
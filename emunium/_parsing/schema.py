@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from typing import Callable, Union
+
+FieldSpec = Union[str, tuple]
+
+
+class _Field:
+    __slots__ = ("name", "css", "attr", "sub")
+
+    def __init__(
+        self,
+        name: str,
+        css: str | None,
+        attr: str | None = None,
+        sub: Schema | None = None,
+    ) -> None:
+        self.name = name
+        self.css = css
+        self.attr = attr
+        self.sub = sub
+
+    def value(self, node: object) -> str | None:
+        if self.attr is not None:
+            return node.attrs.get(self.attr)
+        text = node.text(deep=True)
+        return text.strip() if text is not None else None
+
+
+def _compile_field(name: str, spec: FieldSpec | dict | Schema) -> _Field:
+    if isinstance(spec, str):
+        if spec.startswith("@"):
+            return _Field(name, None, attr=spec[1:])
+        return _Field(name, spec)
+    if isinstance(spec, tuple) and len(spec) == 2:
+        css, target = spec
+        if isinstance(target, (dict, Schema)):
+            return _Field(name, css, sub=Schema.of(target))
+        if target == "text":
+            return _Field(name, css)
+        if isinstance(target, str) and target.startswith("@"):
+            return _Field(name, css, attr=target[1:])
+    raise ValueError(f"Invalid schema spec for {name!r}: {spec!r}")
+
+
+class Schema:
+    """Compiled extraction schema.
+
+    Field specs:
+
+    - ``"css"``: stripped text of the first match
+    - ``("css", "@attr")``: attribute of the first match
+    - ``"@attr"``: attribute of the scope node itself
+    - ``("css", {...})``: one nested record per match
+
+    Specs are validated and compiled once, so a :class:`Schema` can be reused
+    across scopes and pages (and pickled to worker processes). Each scalar
+    field is a native ``css_first`` scoped to its record, and nested lists are
+    resolved from one query per scope.
+    """
+
+    def __init__(self, spec: dict[str, FieldSpec | dict | Schema]) -> None:
+        self._fields = [_compile_field(name, s) for name, s in spec.items()]
+        self._scalars = [f for f in self._fields if f.css and f.sub is None]
+        self._attrs = [f for f in self._fields if f.css is None]
+        self._nested = [f for f in self._fields if f.sub is not None]
+
+    @classmethod
+    def of(cls, spec: dict | Schema) -> Schema:
+        return spec if isinstance(spec, Schema) else cls(spec)
+
+    @property
+    def fields(self) -> list[str]:
+        return [f.name for f in self._fields]
+
+    def run(
+        self,
+        scope: object,
+        *,
+        columns: bool = False,
+        select: Callable[[str], list[object]] | None = None,
+    ) -> dict:
+        out: dict[str, object] = {}
+        for field in self._scalars:
+            node = scope.css_first(field.css)
+            out[field.name] = field.value(node) if node is not None else None
+        attrs = getattr(scope, "attrs", None)
+        for field in self._attrs:
+            out[field.name] = attrs.get(field.attr) if attrs is not None else None
+        for field in self._nested:
+            nodes = select(field.css) if select else scope.css(field.css)
+            out[field.name] = field.sub.run_many(nodes, columns=columns)
+        return {f.name: out[f.name] for f in self._fields}
+
+    def run_many(self, nodes: list[object], *, columns: bool = False) -> list | dict:
+        records = [self.run(node, columns=columns) for node in nodes]
+        return self.to_columns(records) if columns else records
+
+    def to_columns(self, records: list[dict]) -> dict[str, list]:
+        return {name: [r[name] for r in records] for name in self.fields}
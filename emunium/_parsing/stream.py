@@ -0,0 +1,454 @@
+from __future__ import annotations
+
+import io
+import os
+import re
+from collections import deque
+from html.parser import HTMLParser
+from typing import IO, Iterator, Union
+
+from emunium.coords import _attr_match
+
+StreamSource = Union[str, "os.PathLike[str]", IO[str]]
+
+VOID_TAGS = frozenset(
+    {
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "link",
+        "meta",
+        "param",
+        "source",
+        "track",
+        "wbr",
+    }
+)
+
+_AUTO_CLOSE = {
+    "li": {"li"},
+    "p": {"p"},
+    "option": {"option"},
+    "dt": {"dt", "dd"},
+    "dd": {"dt", "dd"},
+    "tr": {"tr", "td", "th"},
+    "td": {"td", "th"},
+    "th": {"td", "th"},
+}
+
+# Open elements an implied end tag never reaches past.
+_CLOSE_SCOPE = {
+    "li": {"ul", "ol", "menu"},
+    "p": {"button", "table", "td", "th"},
+    "option": {"select", "datalist", "optgroup"},
+    "dt": {"dl"},
+    "dd": {"dl"},
+    "tr": {"table", "thead", "tbody", "tfoot"},
+    "td": {"tr", "table"},
+    "th": {"tr", "table"},
+}
+
+_COMPOUND_TOKEN = re.compile(
+    r"\*|([a-zA-Z][a-zA-Z0-9-]*)|#([\w-]+)|\.([\w-]+)"
+    r"|\[\s*([\w:-]+)\s*(?:(\*=|\^=|\$=|~=|=)\s*"
+    r"(?:\"((?:[^\"\\]|\\.)*)\"|'((?:[^'\\]|\\.)*)'|([^\]\s]*)))?\s*\]",
+    re.DOTALL,
+)
+
+_CSS_ESCAPE = re.compile(r"\\(?:([0-9a-fA-F]{1,6})\s?|(.))", re.DOTALL)
+
+
+def _css_unescape(value: str) -> str:
+    """Resolve CSS backslash escapes (``\\"``, ``\\\\``, ``\\a``) in a value."""
+
+    def replace(m: re.Match) -> str:
+        if m.group(1) is None:
+            return m.group(2)
+        code = int(m.group(1), 16)
+        if code == 0 or 0xD800 <= code <= 0xDFFF or code > 0x10FFFF:
+            return "\ufffd"
+        return chr(code)
+
+    return _CSS_ESCAPE.sub(replace, value)
+
+
+def _split_top_level(selector: str, sep: str) -> list[str]:
+    parts: list[str] = []
+    depth = 0
+    quote = ""
+    current: list[str] = []
+    escaped = False
+    for ch in selector:
+        if escaped:
+            escaped = False
+        elif ch == "\\":
+            escaped = True
+        elif quote:
+            quote = "" if ch == quote else quote
+        elif ch in "\"'":
+            quote = ch
+        elif ch in "[(":
+            depth += 1
+        elif ch in "])":
+            depth -= 1
+        elif ch == sep and depth == 0:
+            parts.append("".join(current))
+            current = []
+            continue
+        current.append(ch)
+    parts.append("".join(current))
+    return parts
+
+
+def _closing_paren(text: str, start: int) -> int:
+    depth = 0
+    quote = ""
+    escaped = False
+    for index in range(start, len(text)):
+        ch = text[index]
+        if escaped:
+            escaped = False
+        elif ch == "\\":
+            escaped = True
+        elif quote:
+            quote = "" if ch == quote else quote
+        elif ch in "\"'":
+            quote = ch
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+            if depth == 0:
+                return index
+    raise ValueError(f"Unclosed parenthesis in selector: {text!r}")
+
+
+def _parse_compound(text: str) -> list[dict]:
+    conditions: list[dict] = []
+    pos = 0
+    while pos < len(text):
+        if text.startswith(":not(", pos):
+            close = _closing_paren(text, pos + 4)
+            inner = text[pos + 5 : close].strip()
+            conditions.append({"type": "not", "value": _parse_compound(inner)})
+            pos = close + 1
+            continue
+        m = _COMPOUND_TOKEN.match(text, pos)
+        if not m:
+            raise ValueError(f"Unsupported selector for streaming parser: {text!r}")
+        tag, id_, cls, attr, op, dq, sq, bare = m.groups()
+        if tag:
+            conditions.append({"type": "tag", "value": tag.lower()})
+        elif id_:
+            conditions.append({"type": "attr", "name": "id", "op": "=", "value": id_})
+        elif cls:
+            conditions.append({"type": "class", "value": cls})
+        elif attr and op:
+            value = _css_unescape(next(v for v in (dq, sq, bare) if v is not None))
+            conditions.append({"type": "attr", "name": attr, "op": op, "value": value})
+        elif attr:
+            conditions.append({"type": "attr_present", "name": attr})
+        pos = m.end()
+    return conditions
+
+
+def compile_selector(selector: str) -> list[list[tuple[str, list[dict]]]]:
+    """Compile a CSS subset into right-to-left matching chains.
+
+    Supports ``*``, tag, ``#id``, ``.class``, ``[attr]``, ``[attr op value]``
+    and ``:not(<compound>)`` compounds joined by descendant (space) and child (``>``) combinators, and
+    comma-separated selector lists.
+    """
+    chains = []
+    for part in _split_top_level(selector, ","):
+        spaced = " > ".join(p.strip() for p in _split_top_level(part.strip(), ">"))
+        tokens = [t for t in _split_top_level(spaced, " ") if t]
+        if not tokens:
+            raise ValueError(f"Empty selector in {selector!r}")
+        chain: list[tuple[str, list[dict]]] = []
+        combinator = ""
+        for token in tokens:
+            if token == ">":
+                combinator = ">"
+                continue
+            chain.append((combinator, _parse_compound(token)))
+            combinator = " "
+        chains.append(chain[::-1])
+    return chains
+
+
+def _compound_matches(tag: str, attrs: dict[str, str], conditions: list[dict]) -> bool:
+    for cond in conditions:
+        t = cond["type"]
+        if t == "tag":
+            if tag != cond["value"]:
+                return False
+        elif t == "attr":
+            if cond["name"] not in attrs:
+                return False
+            if not _attr_match(attrs[cond["name"]], cond["op"], cond["value"]):
+                return False
+        elif t == "class":
+            if cond["value"] not in attrs.get("class", "").split():
+                return False
+        elif t == "attr_present":
+            if cond["name"] not in attrs:
+                return False
+        elif t == "not":
+            if _compound_matches(tag, attrs, cond["value"]):
+                return False
+    return True
+
+
+def _chain_matches(
+    chain: list[tuple[str, list[dict]]],
+    path: list[tuple[str, dict[str, str]]],
+) -> bool:
+    """Match *chain* (right-to-left) against *path* (root ... element)."""
+
+    def match_from(step: int, index: int) -> bool:
+        if step == len(chain):
+            return True
+        combinator = chain[step - 1][0]
+        next_conditions = chain[step][1]
+        if combinator == ">":
+            parent = index - 1
+            return (
+                parent >= 0
+                and _compound_matches(*path[parent], next_conditions)
+                and match_from(step + 1, parent)
+            )
+        for ancestor in range(index - 1, -1, -1):
+            if _compound_matches(*path[ancestor], next_conditions) and match_from(
+                step + 1, ancestor
+            ):
+                return True
+        return False
+
+    tag, attrs = path[-1]
+    if not _compound_matches(tag, attrs, chain[0][1]):
+        return False
+    return match_from(1, len(path) - 1)
+
+
+def selector_matches(
+    chains: list[list[tuple[str, list[dict]]]],
+    path: list[tuple[str, dict[str, str]]],
+) -> bool:
+    for chain in chains:
+        if _chain_matches(chain, path):
+            return True
+    return False
+
+
+class StreamNode:
+    """Element captured by the streaming parser.
+
+    Mirrors the subset of the selectolax node API used by :class:`Locator` and
+    :class:`Schema` (``tag``, ``attrs``, ``text()``, ``iter()``, ``css()``,
+    ``css_first()``).
+    """
+
+    __slots__ = ("tag", "attrs", "children", "_ancestors", "closed")
+
+    def __init__(
+        self,
+        tag: str,
+        attrs: dict[str, str],
+        ancestors: list[tuple[str, dict[str, str]]],
+    ) -> None:
+        self.tag = tag
+        self.attrs = attrs
+        self.children: list[StreamNode | str] = []
+        self._ancestors = ancestors
+        self.closed = False
+
+    @property
+    def id(self) -> str | None:
+        return self.attrs.get("id")
+
+    def text(self, deep: bool = True, separator: str = "", strip: bool = False) -> str:
+        parts: list[str] = []
+        self._collect_text(parts, deep, strip)
+        return separator.join(p for p in parts if p) if strip else separator.join(parts)
+
+    def iter(self) -> Iterator[StreamNode]:
+        """Child elements, like selectolax's ``Node.iter()``."""
+        for child in self.children:
+            if isinstance(child, StreamNode):
+                yield child
+
+    def _collect_text(self, parts: list[str], deep: bool, strip: bool) -> None:
+        for child in self.children:
+            if isinstance(child, str):
+                parts.append(child.strip() if strip else child)
+            elif deep:
+                child._collect_text(parts, deep, strip)
+
+    def _iter_descendants(
+        self, path: list[tuple[str, dict[str, str]]]
+    ) -> Iterator[tuple[StreamNode, list[tuple[str, dict[str, str]]]]]:
+        for child in self.children:
+            if isinstance(child, StreamNode):
+                child_path = path + [(child.tag, child.attrs)]
+                yield child, child_path
+                yield from child._iter_descendants(child_path)
+
+    def iter_css(self, selector: str) -> Iterator[StreamNode]:
+        chains = compile_selector(selector)
+        root_path = self._ancestors + [(self.tag, self.attrs)]
+        for node, path in self._iter_descendants(root_path):
+            if selector_matches(chains, path):
+                yield node
+
+    def css(self, selector: str) -> list[StreamNode]:
+        return list(self.iter_css(selector))
+
+    def css_first(self, selector: str) -> StreamNode | None:
+        return next(self.iter_css(selector), None)
+
+    def __repr__(self) -> str:
+        return f"<StreamNode {self.tag}>"
+
+
+class _MatchParser(HTMLParser):
+    def __init__(self, chains: list[list[tuple[str, list[dict]]]]) -> None:
+        super().__init__(convert_charrefs=True)
+        self._chains = chains
+        self._path: list[tuple[str, dict[str, str]]] = []
+        self._open: list[StreamNode | None] = []
+        self._capturing: list[StreamNode] = []
+        self._order: deque[StreamNode] = deque()
+        self.ready: deque[StreamNode] = deque()
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._close_implied(tag)
+        attr_map = {k: v if v is not None else "" for k, v in attrs}
+        self._path.append((tag, attr_map))
+        node: StreamNode | None = None
+        if selector_matches(self._chains, self._path):
+            node = StreamNode(tag, attr_map, self._path[:-1])
+            self._order.append(node)
+        if self._capturing:
+            child = node or StreamNode(tag, attr_map, self._path[:-1])
+            self._capturing[-1].children.append(child)
+            node = child
+        self._open.append(node)
+        if node is not None:
+            self._capturing.append(node)
+        if tag in VOID_TAGS:
+            self._close_top()
+
+    def _close_implied(self, tag: str) -> None:
+        """Close what *tag* implicitly ends, e.g. an open ``td`` and ``tr`` for ``tr``."""
+        closes = _AUTO_CLOSE.get(tag)
+        if not closes:
+            return
+        scope = _CLOSE_SCOPE[tag]
+        depth = None
+        for index in range(len(self._path) - 1, -1, -1):
+            open_tag = self._path[index][0]
+            if open_tag in scope:
+                break
+            if open_tag in closes:
+                depth = index
+        if depth is not None:
+            while len(self._path) > depth:
+                self._close_top()
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS:
+            self._close_top()
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in VOID_TAGS:
+            return
+        for depth in range(len(self._path) - 1, -1, -1):
+            if self._path[depth][0] == tag:
+                while len(self._path) > depth:
+                    self._close_top()
+                return
+
+    def handle_data(self, data: str) -> None:
+        if self._capturing:
+            self._capturing[-1].children.append(data)
+
+    def close(self) -> None:
+        super().close()
+        while self._path:
+            self._close_top()
+
+    def _close_top(self) -> None:
+        self._path.pop()
+        node = self._open.pop()
+        if node is None:
+            return
+        node.closed = True
+        self._capturing.pop()
+        while self._order and self._order[0].closed:
+            self.ready.append(self._order.popleft())
+
+
+def _open_source(source: StreamSource, encoding: str) -> IO[str]:
+    if isinstance(source, os.PathLike):
+        return open(source, encoding=encoding, errors="replace")
+    if isinstance(source, str):
+        return io.StringIO(source)
+    return source
+
+
+def iter_matches(
+    source: StreamSource,
+    selector: str,
+    *,
+    chunk_size: int = 1 << 16,
+    encoding: str = "utf-8",
+) -> Iterator[StreamNode]:
+    """Stream *source* through ``html.parser`` and yield matches in document order.
+
+    Only the open-element stack and the subtrees of matches still being
+    captured are kept in memory, so arbitrarily large files can be scanned.
+    """
+    parser = _MatchParser(compile_selector(selector))
+    fh = _open_source(source, encoding)
+    try:
+        while True:
+            chunk = fh.read(chunk_size)
+            if not chunk:
+                break
+            parser.feed(chunk)
+            while parser.ready:
+                yield parser.ready.popleft()
+        parser.close()
+        while parser.ready:
+            yield parser.ready.popleft()
+    finally:
+        if fh is not source:
+            fh.close()
+
+
+class StreamDocument:
+    """Document-level query scope for the pure-Python fallback parser."""
+
+    def __init__(self, source: StreamSource, encoding: str = "utf-8") -> None:
+        self._source = source
+        self._encoding = encoding
+
+    def iter_css(self, selector: str) -> Iterator[StreamNode]:
+        return iter_matches(self._source, selector, encoding=self._encoding)
+
+    def css(self, selector: str) -> list[StreamNode]:
+        return list(self.iter_css(selector))
+
+    def css_first(self, selector: str) -> StreamNode | None:
+        matches = self.iter_css(selector)
+        try:
+            return next(matches, None)
+        finally:
+            matches.close()
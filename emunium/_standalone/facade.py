@@ -1,13 +1,12 @@
 from __future__ import annotations
 
-import random
-import time
-
 import pyautogui
 from humancursor import SystemCursor
 
 from emunium._standalone import ocr, vision
 from emunium._standalone.config import ClickType, Config, StandaloneConfig
+from emunium._timing import get_policy, timed
+from emunium._typing_engine import replay
 
 
 class Emunium:
@@ -96,26 +95,29 @@ class Emunium:
             raise_on_timeout,
         )
 
+    @timed("hover")
     def move_to(
         self,
         element_center: dict[str, int],
         offset_x: float | None = None,
         offset_y: float | None = None,
     ) -> None:
+        policy = get_policy()
         ox = (
             offset_x
             if offset_x is not None
-            else random.uniform(*Config.DEFAULT_OFFSET_RANGE)
+            else policy.uniform(*Config.DEFAULT_OFFSET_RANGE)
         )
         oy = (
             offset_y
             if offset_y is not None
-            else random.uniform(*Config.DEFAULT_OFFSET_RANGE)
+            else policy.uniform(*Config.DEFAULT_OFFSET_RANGE)
         )
         target_x = round(element_center["x"] + ox)
         target_y = round(element_center["y"] + oy)
         self.cursor.move_to([target_x, target_y])
 
+    @timed("click")
     def click_at(
         self,
         element_center: dict[str, int],
@@ -128,12 +130,13 @@ class Emunium:
             self.cursor.click_on(coord)
         elif click_type == ClickType.DOUBLE:
             self.cursor.click_on(coord)
-            time.sleep(Config.DOUBLE_CLICK_DELAY)
+            get_policy().pause(Config.DOUBLE_CLICK_DELAY)
             self.cursor.click_on(coord)
         else:
             button_map = {ClickType.RIGHT: "right", ClickType.MIDDLE: "middle"}
             pyautogui.click(x=x, y=y, button=button_map[click_type])
 
+    @timed("type")
     def type_at(
         self,
         element_center: dict[str, int],
@@ -146,6 +149,7 @@ class Emunium:
         self.type_text(text, characters_per_minute, offset)
 
     @staticmethod
+    @timed("type")
     def type_text(
         text: str, characters_per_minute: int = 280, offset: int = 20
     ) -> None:
@@ -154,15 +158,19 @@ class Emunium:
         except ImportError:
             _keyboard = None
 
-        time_per_char = 60 / characters_per_minute
-        for char in text:
-            delay = time_per_char + random.uniform(-offset, offset) / 1000
+        def emit(chunk: str) -> None:
             if _keyboard:
-                _keyboard.write(char)
+                _keyboard.write(chunk)
             else:
-                pyautogui.typewrite(char, interval=0)
-            time.sleep(max(0, delay))
+                pyautogui.typewrite(chunk, interval=0)
+
+        policy = get_policy()
+        timeline = policy.timeline(
+            text, characters_per_minute=characters_per_minute, offset=offset
+        )
+        replay(timeline, emit, sleep=policy.wait)
 
+    @timed("scroll")
     def scroll_to(self, element_center: dict[str, int]) -> None:
         window_height = pyautogui.size().height
         scroll_amount = element_center["y"] - window_height // 2
@@ -176,13 +184,14 @@ class Emunium:
         scroll_steps = int(abs_scroll // Config.SCROLL_STEP_SIZE)
         for _ in range(scroll_steps):
             pyautogui.scroll(scroll_direction * Config.SCROLL_STEP_SIZE)
-            time.sleep(random.uniform(*Config.SCROLL_DELAY_RANGE))
+            get_policy().pause(*Config.SCROLL_DELAY_RANGE)
 
         remaining = int(abs_scroll % Config.SCROLL_STEP_SIZE)
         if remaining:
             pyautogui.scroll(scroll_direction * remaining)
-            time.sleep(random.uniform(*Config.SCROLL_DELAY_RANGE))
+            get_policy().pause(*Config.SCROLL_DELAY_RANGE)
 
+    @timed("drag")
     def drag_and_drop(
         self, start_coords: tuple[int, int], end_coords: tuple[int, int]
     ) -> None:
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import functools
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, TypeVar
+
+from emunium._typing_engine import Timeline, build_timeline
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+F = TypeVar("F", bound=Callable)
+
+
+class _ActionStats:
+    __slots__ = ("name", "count", "wall", "wait")
+
+    def __init__(self, name: str = "") -> None:
+        self.name = name
+        self.count = 0
+        self.wall = 0.0
+        self.wait = 0.0
+
+
+class TimingPolicy:
+    """Single source of human delays and random offsets.
+
+    All deliberate pauses, motion durations and typing jitter are drawn from
+    one seedable generator, so a run with the same seed and page replays the
+    same timings. ``scale`` multiplies every delay (see :meth:`fast`); random
+    pixel offsets are drawn from the same generator but never scaled.
+
+    Time spent inside :meth:`action` blocks is recorded, split into
+    deliberate waiting (pauses, paced motion) and everything else.
+    """
+
+    def __init__(self, seed: int | None = None, *, scale: float = 1.0) -> None:
+        if scale <= 0:
+            raise ValueError("scale must be positive")
+        self.seed = seed
+        self.scale = scale
+        self.random = random.Random(seed)
+        self._np_rng: object | None = None
+        self._local = threading.local()
+        self._stats: dict[str, _ActionStats] = {}
+        self._stats_lock = threading.Lock()
+
+    @classmethod
+    def fast(cls, seed: int | None = None, *, scale: float = 0.1) -> TimingPolicy:
+        """Profile for benchmarks and replays: every human delay scaled down."""
+        return cls(seed, scale=scale)
+
+    @property
+    def np_rng(self) -> object | None:
+        """NumPy generator derived from the same seed, for cursor trajectories."""
+        if self._np_rng is None and np is not None:
+            self._np_rng = np.random.default_rng(self.random.getrandbits(64))
+        return self._np_rng
+
+    def uniform(self, low: float, high: float) -> float:
+        return self.random.uniform(low, high)
+
+    def delay(self, low: float, high: float | None = None) -> float:
+        """A scaled duration in seconds, fixed or uniform in ``[low, high]``."""
+        value = low if high is None else self.random.uniform(low, high)
+        return value * self.scale
+
+    def pause(self, low: float, high: float | None = None) -> float:
+        """Sleep for :meth:`delay` and record it as waiting time."""
+        seconds = self.delay(low, high)
+        self.wait(seconds)
+        return seconds
+
+    def wait(self, seconds: float) -> None:
+        """Sleep exactly *seconds* (unscaled), recorded as waiting time."""
+        with self.waiting():
+            time.sleep(seconds)
+
+    def timeline(
+        self, text: str, *, characters_per_minute: int, offset: int
+    ) -> Timeline:
+        return build_timeline(
+            text,
+            characters_per_minute=characters_per_minute / self.scale,
+            offset=offset * self.scale,
+            uniform=self.random.uniform,
+        )
+
+    def _frames(self) -> list[_ActionStats]:
+        frames = getattr(self._local, "frames", None)
+        if frames is None:
+            frames = self._local.frames = []
+        return frames
+
+    @contextmanager
+    def waiting(self) -> Iterator[None]:
+        """Attribute the wall time of the block to deliberate waiting."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            for frame in self._frames():
+                frame.wait += elapsed
+
+    @contextmanager
+    def action(self, name: str) -> Iterator[None]:
+        """Record the block as one *name* action.
+
+        A block nested in an action of the same name (``type_at`` calling
+        ``type_text``) is part of the outer one and is not counted again.
+        """
+        frames = self._frames()
+        if any(active.name == name for active in frames):
+            yield
+            return
+        frame = _ActionStats(name)
+        frames.append(frame)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            frame.wall = time.perf_counter() - started
+            frames.pop()
+            with self._stats_lock:
+                total = self._stats.setdefault(name, _ActionStats())
+                total.count += 1
+                total.wall += frame.wall
+                total.wait += frame.wait
+
+    def report(self) -> dict[str, dict[str, float]]:
+        """Per-action totals: ``count``, ``wall``, ``wait`` and ``work`` seconds."""
+        with self._stats_lock:
+            return {
+                name: {
+                    "count": s.count,
+                    "wall": s.wall,
+                    "wait": s.wait,
+                    "work": max(s.wall - s.wait, 0.0),
+                }
+                for name, s in self._stats.items()
+            }
+
+    def reset_stats(self) -> None:
+        with self._stats_lock:
+            self._stats.clear()
+
+
+_current = TimingPolicy()
+
+
+def get_policy() -> TimingPolicy:
+    return _current
+
+
+def set_policy(policy: TimingPolicy) -> TimingPolicy:
+    """Install *policy* process-wide and return it."""
+    global _current
+    _current = policy
+    return policy
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """Record each call of the decorated function as action *name*."""
+
+    def decorate(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: object, **kwargs: object) -> object:
+            with _current.action(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import random
+import time
+from typing import Callable, List, Tuple
+
+MIN_EVENT_INTERVAL = 0.004
+SPIN_WINDOW = 0.002
+
+Timeline = List[Tuple[float, str]]
+
+
+def build_timeline(
+    text: str,
+    *,
+    characters_per_minute: int,
+    offset: int,
+    min_interval: float = MIN_EVENT_INTERVAL,
+    uniform: Callable[[float, float], float] = random.uniform,
+) -> Timeline:
+    """Precompute ``(due_seconds, chunk)`` pairs for *text*.
+
+    Each character gets the usual ``60 / cpm`` delay plus ``±offset`` ms of
+    jitter. Characters that would fire closer than *min_interval* to the
+    previous event are folded into its chunk, so very fast rates become a few
+    batched writes instead of thousands of tiny sleeps.
+    """
+    base = 60.0 / characters_per_minute
+    timeline: Timeline = []
+    due = 0.0
+    for character in text:
+        if timeline and due - timeline[-1][0] < min_interval:
+            timeline[-1] = (timeline[-1][0], timeline[-1][1] + character)
+        else:
+            timeline.append((due, character))
+        due += max(0.0, base + uniform(-offset, offset) / 1000)
+    return timeline
+
+
+def replay(
+    timeline: Timeline,
+    emit: Callable[[str], None],
+    *,
+    clock: Callable[[], float] = time.perf_counter,
+    sleep: Callable[[float], None] = time.sleep,
+) -> float:
+    """Emit each chunk at its scheduled offset from a single start time.
+
+    Deadlines are absolute, so time spent inside *emit* or oversleeping is
+    absorbed by the following gaps instead of accumulating as drift. Returns
+    the final lag behind schedule in seconds.
+    """
+    start = clock()
+    lag = 0.0
+    for due, chunk in timeline:
+        deadline = start + due
+        remaining = deadline - clock()
+        if remaining > SPIN_WINDOW:
+            sleep(remaining - SPIN_WINDOW)
+        while clock() < deadline:
+            pass
+        emit(chunk)
+        lag = clock() - deadline
+    return lag
@@ -1,3 +1,3 @@
-from emunium._browser.facade import Browser
+from emunium._browser.facade import Browser, Page
 
-__all__ = ["Browser"]
+__all__ = ["Browser", "Page"]
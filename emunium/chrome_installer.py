@@ -1,16 +1,26 @@
 from __future__ import annotations
 
+import contextlib
 import os
 import platform
+import shutil
 import stat
 import sys
+import tempfile
+import urllib.error
 import urllib.request
 import zipfile
 from pathlib import Path
+from typing import Iterator
 
 VERSION_URL = (
     "https://googlechromelabs.github.io/chrome-for-testing/LATEST_RELEASE_STABLE"
 )
+DOWNLOAD_URL = "https://storage.googleapis.com/chrome-for-testing-public"
+MIRROR_ENV = "EMUNIUM_CHROME_MIRROR"
+ARCHIVE_ENV = "EMUNIUM_CHROME_ARCHIVE"
+
+_CHUNK = 1 << 20
 
 
 def _get_platform_tag() -> str:
@@ -48,8 +58,7 @@ def _chrome_executable(install_path: Path, plat: str) -> Path:
         return install_path / f"chrome-{plat}" / "chrome"
 
 
-def _progress_bar(block_num: int, block_size: int, total_size: int) -> None:
-    downloaded = block_num * block_size
+def _progress_bar(downloaded: int, total_size: int) -> None:
     if total_size > 0:
         pct = min(100, downloaded * 100 // total_size)
         bar_len = 40
@@ -64,7 +73,131 @@ def _progress_bar(block_num: int, block_size: int, total_size: int) -> None:
             print()
 
 
-def ensure_chrome() -> str:
+@contextlib.contextmanager
+def _install_lock(dest: Path) -> Iterator[None]:
+    """Exclusive cross-process lock on the install directory."""
+    dest.mkdir(parents=True, exist_ok=True)
+    with open(dest / ".install.lock", "a+b") as handle:
+        if sys.platform == "win32":
+            import msvcrt
+
+            handle.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+            try:
+                yield
+            finally:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def _is_local(source: str) -> bool:
+    return "://" not in source or source.startswith("file://")
+
+
+def _local_path(source: str) -> Path:
+    if source.startswith("file://"):
+        return Path(urllib.request.url2pathname(source[len("file://") :]))
+    return Path(source)
+
+
+def _read_text(source: str) -> str:
+    if _is_local(source):
+        return _local_path(source).read_text(encoding="utf-8").strip()
+    with urllib.request.urlopen(source) as resp:
+        return resp.read().decode().strip()
+
+
+def _download(url: str, target: Path) -> None:
+    """Fetch *url* into *target*, resuming a previous ``.part`` file."""
+    part = target.with_name(target.name + ".part")
+    offset = part.stat().st_size if part.exists() else 0
+    request = urllib.request.Request(url)
+    if offset:
+        request.add_header("Range", f"bytes={offset}-")
+    try:
+        resp = urllib.request.urlopen(request)
+    except urllib.error.HTTPError as e:
+        if e.code != 416:
+            raise
+        # Range not satisfiable: the part file already holds everything.
+        os.replace(part, target)
+        return
+    with resp:
+        if resp.status != 206:
+            offset = 0
+        total = int(resp.headers.get("Content-Length") or 0) + offset
+        with open(part, "ab" if offset else "wb") as out:
+            done = offset
+            while True:
+                chunk = resp.read(_CHUNK)
+                if not chunk:
+                    break
+                out.write(chunk)
+                done += len(chunk)
+                _progress_bar(done, total)
+    if total and part.stat().st_size != total:
+        raise OSError(f"Incomplete download of {url}; rerun to resume")
+    os.replace(part, target)
+
+
+def _fetch_archive(source: str, version: str, plat: str, dest: Path) -> Path:
+    name = f"chrome-{plat}.zip"
+    remote = f"{source.rstrip('/')}/{version}/{plat}/{name}"
+    if _is_local(source):
+        return _local_path(remote)
+    target = dest / f"chrome-{plat}-{version}.zip"
+    if not target.exists():
+        print(f"Downloading Chrome for Testing v{version} ({plat})...")
+        _download(remote, target)
+    return target
+
+
+def _extract(archive: Path, dest: Path, folder: str) -> None:
+    """Extract into a scratch directory, then move the tree into place."""
+    scratch = Path(tempfile.mkdtemp(prefix=".extract-", dir=dest))
+    try:
+        with zipfile.ZipFile(archive, "r") as zf:
+            for info in zf.infolist():
+                path = zf.extract(info, scratch)
+                mode = info.external_attr >> 16
+                if mode and not info.is_dir():
+                    os.chmod(path, stat.S_IMODE(mode))
+        final = dest / folder
+        if final.exists():
+            shutil.rmtree(final)
+        os.replace(scratch / folder, final)
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+def ensure_chrome(*, mirror: str | None = None, archive: str | None = None) -> str:
+    """Return the Chrome for Testing executable, installing it if needed.
+
+    Concurrent callers, including other processes, serialize on a lock file;
+    the first one installs and the rest find the finished tree. Downloads
+    resume from a partial file and the archive is unpacked next to the
+    install before being renamed into place, so an interrupted install never
+    leaves a broken ``chrome`` behind.
+
+    *archive* installs from a local ``chrome-<platform>.zip`` without network
+    access. *mirror* replaces the download host: an URL or directory laid out
+    as ``LATEST_RELEASE_STABLE`` plus ``<version>/<platform>/chrome-<platform>.zip``.
+    Both default to the ``EMUNIUM_CHROME_ARCHIVE`` and
+    ``EMUNIUM_CHROME_MIRROR`` environment variables.
+    """
     plat = _get_platform_tag()
     dest = _install_dir()
     exe = _chrome_executable(dest, plat)
@@ -72,21 +205,32 @@ def ensure_chrome() -> str:
     if exe.exists():
         return str(exe)
 
-    with urllib.request.urlopen(VERSION_URL) as resp:
-        version = resp.read().decode().strip()
-
-    zip_url = f"https://storage.googleapis.com/chrome-for-testing-public/{version}/{plat}/chrome-{plat}.zip"
-
-    print(f"Downloading Chrome for Testing v{version} ({plat})...")
-    dest.mkdir(parents=True, exist_ok=True)
-    tmp_zip = dest / "chrome_download.zip"
-
-    urllib.request.urlretrieve(zip_url, str(tmp_zip), reporthook=_progress_bar)
-
-    print("Extracting...")
-    with zipfile.ZipFile(tmp_zip, "r") as zf:
-        zf.extractall(str(dest))
-    tmp_zip.unlink()
+    archive = archive or os.environ.get(ARCHIVE_ENV)
+    mirror = mirror or os.environ.get(MIRROR_ENV)
+
+    with _install_lock(dest):
+        if exe.exists():
+            return str(exe)
+
+        if archive:
+            zip_path = Path(archive)
+        else:
+            version_source = (
+                f"{mirror.rstrip('/')}/LATEST_RELEASE_STABLE" if mirror else VERSION_URL
+            )
+            version = _read_text(version_source)
+            zip_path = _fetch_archive(mirror or DOWNLOAD_URL, version, plat, dest)
+
+        print("Extracting...")
+        owned = not archive and zip_path.parent == dest
+        try:
+            _extract(zip_path, dest, f"chrome-{plat}")
+        except zipfile.BadZipFile:
+            if owned:
+                zip_path.unlink(missing_ok=True)
+            raise
+        if owned:
+            zip_path.unlink(missing_ok=True)
 
     if sys.platform != "win32" and exe.exists():
         exe.chmod(exe.stat().st_mode | stat.S_IEXEC | stat.S_IXGRP | stat.S_IXOTH)
@@ -1,16 +1,22 @@
 from __future__ import annotations
 
 import logging
-import time
+from typing import Iterable
 
 from emunium._element_interactor import ElementInteractor
 from emunium._standalone.config import ClickType
+from emunium._timing import get_policy, timed
 from emunium.bridge import Bridge
 
 logger = logging.getLogger("emunium.element")
 _INTERACTOR = ElementInteractor()
 
 
+def _is_detached(result: object) -> bool:
+    error = result.get("error", "") if isinstance(result, dict) else ""
+    return "detached" in str(error)
+
+
 class Element:
     """Element handle backed by WebSocket bridge with physical OS-level interactions."""
 
@@ -25,6 +31,10 @@ class Element:
         selector: str | None = None,
         absolute_screen_x: float = 0,
         absolute_screen_y: float = 0,
+        layout_epoch: str | None = None,
+        viewport: dict[str, float] | None = None,
+        dom_epoch: str | None = None,
+        path: str | None = None,
     ) -> None:
         self._bridge = bridge
         self._element_id = element_id
@@ -35,6 +45,11 @@ class Element:
         self._selector = selector
         self._screen_x = absolute_screen_x
         self._screen_y = absolute_screen_y
+        self._layout_epoch = layout_epoch
+        self._viewport = viewport or {}
+        self._dom_epoch = dom_epoch
+        self._path = path
+        bridge.observe_epochs(layout_epoch, dom_epoch)
 
     @classmethod
     def from_data(
@@ -42,7 +57,12 @@ class Element:
         bridge: Bridge,
         data: dict[str, object],
         selector: str | None = None,
+        *,
+        point: tuple[float, float] | None = None,
     ) -> Element:
+        bridge.observe_geometry(data)
+        if point is None:
+            point = bridge.to_screen(data.get("rect") or {})
         return cls(
             bridge=bridge,
             element_id=data.get("elementId", ""),
@@ -51,10 +71,30 @@ class Element:
             rect=data.get("rect", {}),
             text=data.get("text", ""),
             selector=selector,
-            absolute_screen_x=data.get("absoluteScreenX", 0),
-            absolute_screen_y=data.get("absoluteScreenY", 0),
+            absolute_screen_x=point[0],
+            absolute_screen_y=point[1],
+            layout_epoch=data.get("layoutEpoch"),
+            viewport=data.get("viewport"),
+            dom_epoch=data.get("domEpoch"),
+            path=data.get("path"),
         )
 
+    @classmethod
+    def from_list(
+        cls,
+        bridge: Bridge,
+        results: list[dict[str, object]],
+        selector: str | None = None,
+    ) -> list[Element]:
+        """Build handles for a batch, mapping all rects to the screen at once."""
+        for data in results:
+            bridge.observe_geometry(data)
+        points = bridge.to_screen_many([data.get("rect") or {} for data in results])
+        return [
+            cls.from_data(bridge, data, selector, point=point)
+            for data, point in zip(results, points)
+        ]
+
     @property
     def element_id(self) -> str:
         return self._element_id
@@ -94,45 +134,145 @@ class Element:
     def visible(self) -> bool:
         return self._rect.get("width", 0) > 0 and self._rect.get("height", 0) > 0
 
+    @property
+    def is_stale(self) -> bool:
+        """True when the DOM structure may have changed since this handle was read."""
+        return self._dom_epoch is None or self._dom_epoch != self._bridge.dom_epoch
+
     def refresh(self) -> Element:
         if self._selector:
             data = self._bridge.query_selector(self._selector)
             if data:
                 self._update_from_data(data)
+        else:
+            self._relocate()
         return self
 
+    def revalidate(self) -> bool:
+        """Make sure the handle points at a live element.
+
+        Free while the DOM epoch is unchanged; otherwise a single ``relocate``
+        call that keeps the element if it is still attached, or finds it again
+        by its selector path, then by tag and text. A candidate whose text
+        differs is never taken. Actions do not re-bind on their own and raise
+        ``RuntimeError`` on a detached handle; call this first when the page
+        may have re-rendered.
+        """
+        if not self.is_stale:
+            return True
+        return self._relocate()
+
+    def _relocate(self) -> bool:
+        recipe = {"path": self._path or "", "tag": self._tag, "text": self._text}
+        data = self._bridge.relocate(self._element_id, recipe)
+        if not data:
+            return False
+        self._update_from_data(data)
+        return True
+
+    def _check_attached(self, result: dict) -> dict:
+        if _is_detached(result):
+            raise RuntimeError(
+                f"Element {self._element_id} is detached from the page; "
+                "call revalidate() to re-bind it"
+            )
+        return result
+
     def scroll_into_view(self) -> dict:
-        result = self._bridge.scroll_into_view(self._element_id)
-        if "rect" in result:
-            self._rect = result["rect"]
-        if "absoluteScreenX" in result:
-            self._screen_x = result["absoluteScreenX"]
-        if "absoluteScreenY" in result:
-            self._screen_y = result["absoluteScreenY"]
+        result = self._check_attached(self._bridge.scroll_into_view(self._element_id))
+        self._observe_layout(result)
+        if isinstance(result.get("rect"), dict):
+            self._set_rect(result["rect"])
         return result
 
+    def _set_rect(self, rect: dict[str, float]) -> None:
+        self._rect = rect
+        self._screen_x, self._screen_y = self._bridge.to_screen(rect)
+
+    def _observe_layout(self, data: dict[str, object]) -> None:
+        self._bridge.observe_geometry(data)
+        epoch = data.get("layoutEpoch")
+        if epoch is None:
+            return
+        self._layout_epoch = str(epoch)
+        if data.get("domEpoch") is not None:
+            self._dom_epoch = str(data["domEpoch"])
+        viewport = data.get("viewport")
+        self._viewport = viewport if isinstance(viewport, dict) else self._viewport
+        self._bridge.observe_epochs(self._layout_epoch, data.get("domEpoch"))
+
+    def _in_view(self) -> bool:
+        """True when the cached rect is fully visible and the layout is unchanged."""
+        if self._layout_epoch is None:
+            return False
+        if self._layout_epoch != self._bridge.layout_epoch:
+            return False
+        x = self._rect.get("x", 0)
+        y = self._rect.get("y", 0)
+        width = self._rect.get("width", 0)
+        height = self._rect.get("height", 0)
+        return (
+            width > 0
+            and height > 0
+            and x >= 0
+            and y >= 0
+            and x + width <= self._viewport.get("width", 0)
+            and y + height <= self._viewport.get("height", 0)
+        )
+
+    def _ensure_in_view(self) -> None:
+        if not self._in_view():
+            self.scroll_into_view()
+
     def _update_from_data(self, data: dict[str, object]) -> None:
         self._element_id = str(data.get("elementId", self._element_id))
         self._tag = str(data.get("tag", self._tag))
         attrs = data.get("attrs", self._attrs)
-        rect = data.get("rect", self._rect)
         self._attrs = attrs if isinstance(attrs, dict) else self._attrs
-        self._rect = rect if isinstance(rect, dict) else self._rect
         self._text = str(data.get("text", self._text))
-        self._screen_x = float(data.get("absoluteScreenX", self._screen_x))
-        self._screen_y = float(data.get("absoluteScreenY", self._screen_y))
+        self._path = data.get("path", self._path)
+        self._observe_layout(data)
+        rect = data.get("rect")
+        if isinstance(rect, dict):
+            self._set_rect(rect)
 
     def _current_screen_point(self) -> tuple[int, int]:
         return int(self._screen_x), int(self._screen_y)
 
+    def _fresh_screen_point(self) -> tuple[int, int]:
+        self._ensure_in_view()
+        return self._current_screen_point()
+
+    def _has_screen_point(self) -> bool:
+        return bool(self._screen_x or self._screen_y)
+
+    def _prepare_path_to(self, other: Element) -> None:
+        """Plan the cursor path from this element to *other* in the background."""
+        if self._has_screen_point() and other._has_screen_point():
+            _INTERACTOR.prepare_move(
+                *other._current_screen_point(), start=self._current_screen_point()
+            )
+
+    @timed("click")
     def _click(
         self,
         click_type: ClickType = ClickType.LEFT,
         *,
         human: bool = True,
     ) -> None:
-        self.scroll_into_view()
-        x, y = int(self._screen_x), int(self._screen_y)
+        if human and self._has_screen_point() and not self._in_view():
+            logger.info(
+                "Clicking element near Screen%s type=%s (pipelined)",
+                self._current_screen_point(),
+                click_type.name,
+            )
+            _INTERACTOR.click_pipelined(
+                self._current_screen_point(),
+                self._fresh_screen_point,
+                click_type=click_type,
+            )
+            return
+        x, y = self._fresh_screen_point()
         logger.info(
             "Clicking element at Screen(%d, %d) type=%s human=%s",
             x,
@@ -142,6 +282,7 @@ class Element:
         )
         _INTERACTOR.click(x, y, click_type=click_type, human=human)
 
+    @timed("hover")
     def hover(
         self,
         offset_x: float | None = None,
@@ -149,7 +290,7 @@ class Element:
         *,
         human: bool = True,
     ) -> None:
-        self.scroll_into_view()
+        self._ensure_in_view()
         x, y = _INTERACTOR.screen_point(
             self._screen_x,
             self._screen_y,
@@ -180,6 +321,7 @@ class Element:
     def middle_click(self, *, human: bool = True) -> None:
         self._click(ClickType.MIDDLE, human=human)
 
+    @timed("type")
     def type(
         self,
         text: str,
@@ -188,9 +330,10 @@ class Element:
         offset: int = 20,
         human: bool = True,
         click_type: ClickType = ClickType.LEFT,
+        paste_threshold: int | None = None,
     ) -> None:
         self._click(click_type, human=human)
-        time.sleep(0.1)
+        get_policy().pause(0.1)
         logger.info(
             "Typing %d chars into element at Screen(%d, %d)",
             len(text),
@@ -201,18 +344,38 @@ class Element:
             text,
             characters_per_minute=characters_per_minute,
             offset=offset,
+            paste_threshold=paste_threshold,
         )
 
+    @timed("drag")
     def drag_to(self, target: Element, *, human: bool = True) -> None:
-        self.scroll_into_view()
-        target.scroll_into_view()
+        if (
+            human
+            and self._has_screen_point()
+            and target._has_screen_point()
+            and not (self._in_view() and target._in_view())
+        ):
+            logger.info(
+                "Dragging from near Screen%s to near Screen%s (pipelined)",
+                self._current_screen_point(),
+                target._current_screen_point(),
+            )
+            _INTERACTOR.drag_pipelined(
+                self._current_screen_point(),
+                self._fresh_screen_point,
+                target._current_screen_point(),
+                target._fresh_screen_point,
+            )
+            return
+        self._ensure_in_view()
+        target._ensure_in_view()
         start = self._current_screen_point()
         end = target._current_screen_point()
         logger.info("Dragging from Screen%s to Screen%s", start, end)
         _INTERACTOR.drag(start, end, human=human)
 
     def focus(self) -> dict:
-        return self._bridge.focus(self._element_id)
+        return self._check_attached(self._bridge.focus(self._element_id))
 
     def get_attribute(self, name: str) -> str | None:
         return self._bridge.get_attribute(self._element_id, name)
@@ -220,6 +383,61 @@ class Element:
     def get_computed_style(self, prop: str) -> str | None:
         return self._bridge.get_computed_style(self._element_id, prop)
 
+    def read(
+        self,
+        attrs: Iterable[str] = (),
+        styles: Iterable[str] = (),
+        props: Iterable[str] = (),
+        *,
+        revalidate: bool = False,
+    ) -> dict[str, dict[str, object]]:
+        """Read attributes, computed styles and DOM properties in one call.
+
+        Returns ``{"attrs": {...}, "styles": {...}, "props": {...}}``, or
+        ``{"error": ...}`` for a detached handle (see :meth:`read_many`).
+        """
+        return Element.read_many(
+            [self], attrs=attrs, styles=styles, props=props, revalidate=revalidate
+        )[0]
+
+    @staticmethod
+    def read_many(
+        elements: list[Element],
+        attrs: Iterable[str] = (),
+        styles: Iterable[str] = (),
+        props: Iterable[str] = (),
+        *,
+        revalidate: bool = False,
+    ) -> list[dict[str, dict[str, object]]]:
+        """:meth:`read` for several handles with a single bridge call.
+
+        A detached handle gets its ``{"error": ...}`` result; handles are
+        never re-bound silently. With ``revalidate=True`` detached handles
+        are re-bound as by :meth:`revalidate` and read again in one extra call.
+        """
+        if not elements:
+            return []
+        bridge = elements[0]._bridge
+        names = (list(attrs), list(styles), list(props))
+        ids = [el.element_id for el in elements]
+        results = bridge.read_elements(ids, *names)
+        if len(results) != len(elements):
+            raise RuntimeError("Failed to read elements from the page")
+        if not revalidate:
+            return results
+        stale = [
+            index
+            for index, result in enumerate(results)
+            if _is_detached(result) and elements[index]._relocate()
+        ]
+        if stale:
+            retried = bridge.read_elements(
+                [elements[i].element_id for i in stale], *names
+            )
+            for index, result in zip(stale, retried):
+                results[index] = result
+        return results
+
     def __repr__(self) -> str:
         return (
             f"Element(id={self._element_id!r}, "
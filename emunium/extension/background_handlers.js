@@ -38,14 +38,24 @@
 
     scope.state.pinnedTabId = tabId;
     try {
+      const started = performance.now();
       scope.clearTrackedTab(tabId);
       await chrome.tabs.update(tabId, { url: msg.params.url });
       await waitForTabLoad(tabId, msg.params.timeout || 30000);
-      await scope.waitForContentReady(tabId, 5000);
+      const loaded = performance.now();
+      const contentReady = await scope.waitForContentReady(tabId, 5000);
+      const ready = performance.now();
       const tab = await chrome.tabs.get(tabId);
       scope.send({
         id: msg.id,
-        result: { success: true, url: tab.url, title: tab.title, tabId },
+        result: {
+          success: true,
+          url: tab.url,
+          title: tab.title,
+          tabId,
+          contentReady,
+          timing: { loadMs: loaded - started, contentReadyMs: ready - loaded },
+        },
       });
     } catch (error) {
       sendError(msg.id, error.message);
@@ -67,13 +77,31 @@
 
   async function handleCreateTab(msg) {
     try {
-      const tab = await chrome.tabs.create({ url: msg.params?.url || "about:blank" });
+      const tab = await chrome.tabs.create({
+        url: msg.params?.url || "about:blank",
+        active: msg.params?.active ?? true,
+      });
       scope.send({ id: msg.id, result: { tabId: tab.id, url: tab.url } });
     } catch (error) {
       sendError(msg.id, error.message);
     }
   }
 
+  async function handleActivateTab(msg) {
+    const tabId = await scope.resolveTabId(msg);
+    if (!tabId) {
+      sendError(msg.id, "No active tab");
+      return;
+    }
+    try {
+      const tab = await chrome.tabs.update(tabId, { active: true });
+      await chrome.windows.update(tab.windowId, { focused: true });
+      scope.send({ id: msg.id, result: { success: true, tabId } });
+    } catch (error) {
+      sendError(msg.id, error.message);
+    }
+  }
+
   async function handleExecuteScript(msg) {
     const tabId = await scope.resolveTabId(msg);
     if (!tabId) {
@@ -132,6 +160,35 @@
     }
   }
 
+  async function handleResetSession(msg) {
+    try {
+      const tabs = await chrome.tabs.query({});
+      const fresh = await chrome.tabs.create({ url: "about:blank", active: true });
+      scope.state.pinnedTabId = fresh.id;
+      await Promise.all(
+        tabs.map((tab) => chrome.tabs.remove(tab.id).catch(() => {}))
+      );
+      await chrome.browsingData.remove(
+        { since: 0 },
+        {
+          cacheStorage: true,
+          cookies: true,
+          fileSystems: true,
+          indexedDB: true,
+          localStorage: true,
+          serviceWorkers: true,
+          webSQL: true,
+        }
+      );
+      scope.state.readyTabs.clear();
+      scope.state.tabDocIds.clear();
+      scope.clearRecentResponses();
+      scope.send({ id: msg.id, result: { success: true, tabId: fresh.id } });
+    } catch (error) {
+      sendError(msg.id, error.message);
+    }
+  }
+
   async function handleWaitForResponse(msg) {
     const pattern = msg.params?.pattern;
     const timeout = msg.params?.timeout || 10000;
@@ -140,7 +197,11 @@
       return;
     }
     try {
-      const result = await scope.waitForResponse(pattern, timeout);
+      const result = await scope.waitForResponse(
+        pattern,
+        timeout,
+        msg.params?.tabId ?? null
+      );
       if (result) {
         scope.send({ id: msg.id, result });
       } else {
@@ -167,6 +228,10 @@
       await handleCreateTab(msg);
       return;
     }
+    if (msg.method === "activateTab") {
+      await handleActivateTab(msg);
+      return;
+    }
     if (msg.method === "closeTab") {
       await handleCloseTab(msg);
       return;
@@ -175,6 +240,10 @@
       await handleExecuteScript(msg);
       return;
     }
+    if (msg.method === "resetSession") {
+      await handleResetSession(msg);
+      return;
+    }
     if (msg.method === "waitForResponse") {
       await handleWaitForResponse(msg);
       return;
@@ -182,7 +251,9 @@
     if (msg.method === "getRecentResponses") {
       scope.send({
         id: msg.id,
-        result: { responses: scope.getRecentResponses() },
+        result: {
+          responses: scope.getRecentResponses(msg.params?.tabId ?? null),
+        },
       });
       return;
     }
@@ -201,7 +272,13 @@
   function attachSocketHandlers(socket) {
     socket.onopen = () => {
       console.log("[emunium] Connected to bridge:", scope.state.wsUrl);
-      scope.clearReconnect();
+      socket.send(
+        JSON.stringify({
+          event: "hello",
+          token: scope.state.token,
+          pinnedTabId: scope.state.pinnedTabId,
+        })
+      );
       scope.startKeepAlive(socket);
     };
 
@@ -212,6 +289,12 @@
       } catch {
         return;
       }
+      if (msg.event === "welcome") {
+        // Only an accepted hello resets the backoff; a bridge that rejects
+        // our token closes straight away and the delay keeps doubling.
+        scope.clearReconnect();
+        return;
+      }
       await routeBridgeMessage(msg);
     };
 
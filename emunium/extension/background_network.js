@@ -20,6 +20,13 @@
     return regex.test(url);
   }
 
+  function matchesWaiter(entry, waiter) {
+    return (
+      (waiter.tabId == null || entry.tabId === waiter.tabId) &&
+      matchesPattern(entry.url, waiter.pattern)
+    );
+  }
+
   function addResponse(details) {
     const entry = {
       url: details.url,
@@ -37,7 +44,7 @@
 
     const remaining = [];
     for (const waiter of networkState.pendingWaiters) {
-      if (matchesPattern(entry.url, waiter.pattern)) {
+      if (matchesWaiter(entry, waiter)) {
         waiter.resolve(entry);
       } else {
         remaining.push(waiter);
@@ -46,16 +53,16 @@
     networkState.pendingWaiters = remaining;
   }
 
-  function waitForResponse(pattern, timeoutMs) {
+  function waitForResponse(pattern, timeoutMs, tabId = null) {
     const existing = networkState.recentResponses.find((r) =>
-      matchesPattern(r.url, pattern)
+      matchesWaiter(r, { pattern, tabId })
     );
     if (existing) {
       return Promise.resolve(existing);
     }
 
     return new Promise((resolve) => {
-      const waiter = { pattern, resolve };
+      const waiter = { pattern, tabId, resolve };
       networkState.pendingWaiters.push(waiter);
 
       setTimeout(() => {
@@ -68,8 +75,15 @@
     });
   }
 
-  function getRecentResponses() {
-    return networkState.recentResponses.slice();
+  function getRecentResponses(tabId = null) {
+    if (tabId == null) {
+      return networkState.recentResponses.slice();
+    }
+    return networkState.recentResponses.filter((r) => r.tabId === tabId);
+  }
+
+  function clearRecentResponses() {
+    networkState.recentResponses.length = 0;
   }
 
   if (typeof chrome !== "undefined" && chrome.webRequest) {
@@ -83,5 +97,6 @@
     networkState,
     waitForResponse,
     getRecentResponses,
+    clearRecentResponses,
   });
 })();
@@ -46,6 +46,17 @@
     });
   }
 
+  function handleLayoutMessage(msg, sender) {
+    if (sender.frameId === 0) {
+      scope.send({
+        event: "layoutChanged",
+        tabId: sender.tab.id,
+        epoch: msg.epoch,
+        domEpoch: msg.domEpoch,
+      });
+    }
+  }
+
   function registerRuntimeListeners() {
     chrome.runtime.onMessage.addListener((msg, sender, sendResponse) => {
       if (msg.__emunium_exec__ && sender.tab) {
@@ -54,6 +65,9 @@
       if (msg.__emunium_ready__ && sender.tab) {
         handleReadyMessage(msg, sender);
       }
+      if (msg.__emunium_layout__ && sender.tab) {
+        handleLayoutMessage(msg, sender);
+      }
       return undefined;
     });
 
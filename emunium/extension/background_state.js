@@ -5,13 +5,15 @@
   const state = scope.state || {
     ws: null,
     wsUrl: null,
+    token: null,
     reconnectTimer: null,
+    reconnectDelay: 0,
     readyTabs: new Set(),
     tabDocIds: new Map(),
     pinnedTabId: null,
   };
 
-  async function getPort() {
+  async function getBridgeConfig() {
     try {
       const response = await fetch(
         chrome.runtime.getURL("port.json") + "?t=" + Date.now(),
@@ -20,7 +22,7 @@
       if (response.ok) {
         const data = await response.json();
         if (data.port) {
-          return data.port;
+          return data;
         }
       }
     } catch {}
@@ -28,6 +30,7 @@
   }
 
   function clearReconnect() {
+    state.reconnectDelay = 0;
     if (state.reconnectTimer) {
       clearTimeout(state.reconnectTimer);
       state.reconnectTimer = null;
@@ -61,10 +64,17 @@
     }
   }
 
-  function scheduleReconnect(delay) {
+  // Retries start fast so a dropped socket costs milliseconds, then back
+  // off to the given ceiling while the bridge stays unreachable.
+  function scheduleReconnect(maxDelay) {
     if (state.reconnectTimer) {
       return;
     }
+    const delay = Math.min(
+      maxDelay,
+      state.reconnectDelay ? state.reconnectDelay * 2 : 100
+    );
+    state.reconnectDelay = delay;
     state.reconnectTimer = setTimeout(() => {
       state.reconnectTimer = null;
       connect();
@@ -75,13 +85,14 @@
     if (state.ws && state.ws.readyState === WebSocket.OPEN) {
       return;
     }
-    const port = await getPort();
-    if (!port) {
+    const config = await getBridgeConfig();
+    if (!config) {
       scheduleReconnect(2000);
       return;
     }
 
-    state.wsUrl = `ws://127.0.0.1:${port}`;
+    state.wsUrl = `ws://127.0.0.1:${config.port}`;
+    state.token = config.token || null;
     try {
       state.ws = new WebSocket(state.wsUrl);
     } catch {
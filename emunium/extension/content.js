@@ -5,16 +5,38 @@
 
   function scrollIntoView({ elementId }) {
     return scope.withResolvedElement(elementId, (element) => {
-      const coords = scope.getAbsoluteCoords(element, { scroll: true });
-      return {
-        success: true,
-        rect: scope.toRectPayload(coords.rect),
-        absoluteScreenX: coords.absoluteScreenX,
-        absoluteScreenY: coords.absoluteScreenY,
-      };
+      const rect = scope.measureElement(element, { scroll: true });
+      return scope.stampLayout({ success: true, rect: scope.toRectPayload(rect) });
     });
   }
 
+  function findByRecipe({ path, tag, text }) {
+    const wanted = (text || "").trim();
+    const textMatches = (element) => scope.getElementText(element).trim() === wanted;
+    let candidate = null;
+    try {
+      candidate = path ? document.querySelector(path) : null;
+    } catch {}
+    if (candidate && candidate.tagName.toLowerCase() !== tag) {
+      candidate = null;
+    }
+    if (candidate && (!wanted || textMatches(candidate))) {
+      return candidate;
+    }
+    if (tag && wanted) {
+      return Array.from(document.getElementsByTagName(tag)).find(textMatches) || null;
+    }
+    return null;
+  }
+
+  function relocate({ elementId, path, tag, text }) {
+    const element = scope.resolveElement(elementId) || findByRecipe({ path, tag, text });
+    if (!element) {
+      return { error: "Element not found or detached" };
+    }
+    return scope.serializeElement(element);
+  }
+
   function scrollToPosition({ x, y }) {
     window.scrollTo(x, y);
     return { scrollX: window.scrollX, scrollY: window.scrollY };
@@ -38,6 +60,11 @@
     };
   }
 
+  function getWindowGeometry() {
+    scope.takeGeometryChange();
+    return { ...scope.layout.geometry, version: scope.getGeometryVersion() };
+  }
+
   function executeScript({ code }) {
     return new Promise((resolve) => {
       chrome.runtime.sendMessage({ __emunium_exec__: true, code }, (response) => {
@@ -69,14 +96,46 @@
     }));
   }
 
+  function toPropValue(value) {
+    if (value === undefined || value === null) {
+      return null;
+    }
+    const kind = typeof value;
+    if (kind === "string" || kind === "number" || kind === "boolean") {
+      return value;
+    }
+    return String(value);
+  }
+
+  function readElement(element, attrs, styles, props) {
+    const result = { attrs: {}, styles: {}, props: {} };
+    for (const name of attrs) {
+      result.attrs[name] = element.getAttribute(name);
+    }
+    if (styles.length > 0) {
+      const computed = window.getComputedStyle(element);
+      for (const name of styles) {
+        result.styles[name] = computed.getPropertyValue(name);
+      }
+    }
+    for (const name of props) {
+      result.props[name] = toPropValue(element[name]);
+    }
+    return result;
+  }
+
+  function readElements({ elementIds, attrs, styles, props }) {
+    return (elementIds || []).map((elementId) =>
+      scope.withResolvedElement(elementId, (element) =>
+        readElement(element, attrs || [], styles || [], props || [])
+      )
+    );
+  }
+
   function getElementCoords({ elementId }) {
     return scope.withResolvedElement(elementId, (element) => {
-      const coords = scope.getAbsoluteCoords(element, { scroll: true });
-      return {
-        absoluteScreenX: coords.absoluteScreenX,
-        absoluteScreenY: coords.absoluteScreenY,
-        rect: scope.toRectPayload(coords.rect),
-      };
+      const rect = scope.measureElement(element, { scroll: true });
+      return scope.stampLayout({ rect: scope.toRectPayload(rect) });
     });
   }
 
@@ -86,14 +145,20 @@
     queryXPath: scope.queryXPath,
     queryByText: scope.queryByText,
     getAllInteractive: scope.getAllInteractive,
+    locatorAll: scope.locatorAll,
+    locatorCount: scope.locatorCount,
+    relocate,
     scrollIntoView,
     scrollTo: scrollToPosition,
     pageInfo: getPageInfo,
+    windowGeometry: getWindowGeometry,
     executeScript,
     waitForSelector: scope.waitForSelector,
+    waitForAll: scope.waitForAll,
     focus: focusElement,
     getAttribute,
     getComputedStyle: getComputedStyleProp,
+    readElements,
     getElementCoords,
     ping: () => ({ pong: true, url: location.href }),
   };
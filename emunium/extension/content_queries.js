@@ -37,6 +37,36 @@
     return scope.findElementsByText(text, Boolean(exact)).map(scope.serializeElement);
   }
 
+  function applyLocatorFilters(elements, filters) {
+    let result = elements;
+    for (const filter of filters || []) {
+      if (filter.type === "has_text") {
+        const needle = String(filter.value).toLowerCase();
+        result = result.filter((element) =>
+          scope.getElementText(element, Infinity).toLowerCase().includes(needle)
+        );
+      } else if (filter.type === "matches") {
+        result = result.filter((element) => element.matches(filter.selector));
+      } else if (filter.type === "nth") {
+        const index = filter.index < 0 ? result.length + filter.index : filter.index;
+        result = index >= 0 && index < result.length ? [result[index]] : [];
+      }
+    }
+    return result;
+  }
+
+  function findLocatorElements(selector, filters) {
+    return applyLocatorFilters(Array.from(document.querySelectorAll(selector)), filters);
+  }
+
+  function locatorAll({ selector, filters }) {
+    return findLocatorElements(selector, filters).map(scope.serializeElement);
+  }
+
+  function locatorCount({ selector, filters }) {
+    return { count: findLocatorElements(selector, filters).length };
+  }
+
   function getAllInteractive() {
     return Array.from(document.querySelectorAll(scope.INTERACTIVE_SELECTOR))
       .filter((element) => {
@@ -47,7 +77,11 @@
   }
 
   Object.assign(scope, {
+    applyLocatorFilters,
+    findLocatorElements,
     getAllInteractive,
+    locatorAll,
+    locatorCount,
     queryByText,
     querySelector,
     querySelectorAll,
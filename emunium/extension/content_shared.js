@@ -3,6 +3,16 @@
 
   const scope = (globalThis.EmuniumContent = globalThis.EmuniumContent || {});
   const state = scope.state || { elements: new Map(), nextId: 1 };
+  const layout = scope.layout || {
+    token: Math.random().toString(36).slice(2, 10),
+    count: 0,
+    dom: 0,
+    notified: false,
+    domNotified: false,
+    scrollX: 0,
+    scrollY: 0,
+    geometryVersion: 0,
+  };
   const INTERACTIVE_SELECTOR =
     "input,button,a,textarea,select,[role],[aria-label],[data-state]," +
     "[placeholder],[data-testid],[name],[type],[contenteditable]";
@@ -33,13 +43,116 @@
     return element;
   }
 
-  function getWindowBorders() {
+  function getLayoutEpoch() {
+    return layout.token + ":" + layout.count;
+  }
+
+  function getDomEpoch() {
+    return layout.token + ":" + layout.dom;
+  }
+
+  function notifyLayout() {
+    try {
+      chrome.runtime.sendMessage({
+        __emunium_layout__: true,
+        epoch: getLayoutEpoch(),
+        domEpoch: getDomEpoch(),
+      });
+    } catch {}
+  }
+
+  function bumpLayoutEpoch(structural = false) {
+    layout.count += 1;
+    if (structural) {
+      layout.dom += 1;
+    }
+    if (window !== window.top) {
+      return;
+    }
+    if (!layout.notified || (structural && !layout.domNotified)) {
+      layout.notified = true;
+      layout.domNotified = layout.domNotified || structural;
+      notifyLayout();
+    }
+  }
+
+  function onMutations(records) {
+    bumpLayoutEpoch(records.some((record) => record.type === "childList"));
+  }
+
+  function onScroll(event) {
+    const target = event.target;
+    if (target === document || target === document.documentElement) {
+      if (window.scrollX === layout.scrollX && window.scrollY === layout.scrollY) {
+        return;
+      }
+      layout.scrollX = window.scrollX;
+      layout.scrollY = window.scrollY;
+    }
+    bumpLayoutEpoch();
+  }
+
+  function watchLayout() {
+    if (layout.observer) {
+      return;
+    }
+    layout.scrollX = window.scrollX;
+    layout.scrollY = window.scrollY;
+    layout.observer = new MutationObserver(onMutations);
+    layout.observer.observe(document, {
+      subtree: true,
+      childList: true,
+      attributes: true,
+      characterData: true,
+    });
+    window.addEventListener("scroll", onScroll, { capture: true, passive: true });
+    window.addEventListener("resize", () => bumpLayoutEpoch(), { passive: true });
+  }
+
+  function stampLayout(payload) {
+    layout.notified = false;
+    layout.domNotified = false;
+    payload.layoutEpoch = getLayoutEpoch();
+    payload.domEpoch = getDomEpoch();
+    payload.viewport = { width: window.innerWidth, height: window.innerHeight };
+    const geometry = takeGeometryChange();
+    if (geometry) {
+      payload.geometry = geometry;
+    }
+    payload.geometryVersion = getGeometryVersion();
+    return payload;
+  }
+
+  function getWindowGeometry() {
     return {
+      screenX: window.screenX,
+      screenY: window.screenY,
       left: (window.outerWidth - window.innerWidth) / 2,
       top: window.outerHeight - window.innerHeight,
     };
   }
 
+  function takeGeometryChange() {
+    const geometry = getWindowGeometry();
+    const last = layout.geometry;
+    if (
+      last &&
+      last.screenX === geometry.screenX &&
+      last.screenY === geometry.screenY &&
+      last.left === geometry.left &&
+      last.top === geometry.top
+    ) {
+      return null;
+    }
+    layout.geometry = geometry;
+    layout.geometryVersion = (layout.geometryVersion || 0) + 1;
+    return geometry;
+  }
+
+  function getGeometryVersion() {
+    return layout.token + ":" + (layout.geometryVersion || 0);
+  }
+
   function toRectPayload(rect) {
     return { x: rect.x, y: rect.y, width: rect.width, height: rect.height };
   }
@@ -48,17 +161,16 @@
     return (element.innerText || element.textContent || "").slice(0, maxLength);
   }
 
-  function getAbsoluteCoords(element, { scroll = false } = {}) {
+  function measureElement(element, { scroll = false } = {}) {
     if (scroll) {
       element.scrollIntoView({ behavior: "instant", block: "center" });
+      if (window.scrollX !== layout.scrollX || window.scrollY !== layout.scrollY) {
+        layout.scrollX = window.scrollX;
+        layout.scrollY = window.scrollY;
+        layout.count += 1;
+      }
     }
-    const rect = element.getBoundingClientRect();
-    const borders = getWindowBorders();
-    return {
-      absoluteScreenX: window.screenX + borders.left + rect.x + rect.width / 2,
-      absoluteScreenY: window.screenY + borders.top + rect.y + rect.height / 2,
-      rect,
-    };
+    return element.getBoundingClientRect();
   }
 
   function collectAttributes(element) {
@@ -69,19 +181,45 @@
     return attrs;
   }
 
+  function getSelectorPath(element) {
+    const parts = [];
+    let node = element;
+    while (node && node !== document.documentElement) {
+      const tag = node.tagName.toLowerCase();
+      if (node.id) {
+        const idSelector = "#" + CSS.escape(node.id);
+        if (document.querySelectorAll(idSelector).length === 1) {
+          parts.unshift(idSelector);
+          return parts.join(" > ");
+        }
+      }
+      let index = 1;
+      let sibling = node.previousElementSibling;
+      while (sibling) {
+        if (sibling.tagName === node.tagName) {
+          index += 1;
+        }
+        sibling = sibling.previousElementSibling;
+      }
+      parts.unshift(tag + ":nth-of-type(" + index + ")");
+      node = node.parentElement;
+    }
+    parts.unshift("html");
+    return parts.join(" > ");
+  }
+
   function serializeElement(element) {
-    const coords = getAbsoluteCoords(element);
-    return {
+    const rect = measureElement(element);
+    return stampLayout({
       elementId: getElementId(element),
       tag: element.tagName.toLowerCase(),
       attrs: collectAttributes(element),
-      rect: toRectPayload(coords.rect),
+      rect: toRectPayload(rect),
       text: getElementText(element),
-      visible: coords.rect.width > 0 && coords.rect.height > 0,
+      path: getSelectorPath(element),
+      visible: rect.width > 0 && rect.height > 0,
       value: element.value !== undefined ? element.value : null,
-      absoluteScreenX: coords.absoluteScreenX,
-      absoluteScreenY: coords.absoluteScreenY,
-    };
+    });
   }
 
   function withResolvedElement(elementId, callback) {
@@ -115,13 +253,23 @@
   Object.assign(scope, {
     INTERACTIVE_SELECTOR,
     findElementsByText,
-    getAbsoluteCoords,
     getElementId,
     getElementText,
+    getDomEpoch,
+    getGeometryVersion,
+    getLayoutEpoch,
+    getSelectorPath,
+    getWindowGeometry,
+    layout,
+    measureElement,
     resolveElement,
     serializeElement,
+    stampLayout,
+    takeGeometryChange,
     state,
     toRectPayload,
     withResolvedElement,
   });
+
+  watchLayout();
 })();
@@ -3,7 +3,7 @@
 
   const scope = globalThis.EmuniumContent;
 
-  function buildFinder(selector, type) {
+  function buildFinder(selector, type, filters) {
     if (type === "xpath") {
       return () =>
         document.evaluate(
@@ -17,10 +17,13 @@
     if (type === "text") {
       return () => scope.findElementsByText(selector)[0] || null;
     }
+    if (Array.isArray(filters) && filters.length > 0) {
+      return () => scope.findLocatorElements(selector, filters)[0] || null;
+    }
     return () => document.querySelector(selector);
   }
 
-  function buildAllFinder(selector, type) {
+  function buildAllFinder(selector, type, filters) {
     if (type === "xpath") {
       return () => {
         const result = document.evaluate(
@@ -40,6 +43,9 @@
     if (type === "text") {
       return () => scope.findElementsByText(selector);
     }
+    if (Array.isArray(filters) && filters.length > 0) {
+      return () => scope.findLocatorElements(selector, filters);
+    }
     return () => Array.from(document.querySelectorAll(selector));
   }
 
@@ -204,7 +210,7 @@
     return { finish, maybeResolve, seed };
   }
 
-  function waitForSelector({ selector, type, timeout, state, conditions }) {
+  function waitForSelector({ selector, type, timeout, state, conditions, filters }) {
     const options = {
       conditions,
       needsStable: needsStableState(state, conditions),
@@ -213,8 +219,8 @@
       state,
     };
     const selectorType = type || "css";
-    const findElement = buildFinder(selector, selectorType);
-    const findAllElements = buildAllFinder(selector, selectorType);
+    const findElement = buildFinder(selector, selectorType, filters);
+    const findAllElements = buildAllFinder(selector, selectorType, filters);
     const timeoutMs = timeout || 10000;
 
     return new Promise((resolve) => {
@@ -243,5 +249,11 @@
     });
   }
 
-  Object.assign(scope, { waitForSelector });
+  function waitForAll({ selectors, timeout }) {
+    return Promise.all(
+      (selectors || []).map((selector) => waitForSelector({ selector, timeout }))
+    );
+  }
+
+  Object.assign(scope, { waitForAll, waitForSelector });
 })();
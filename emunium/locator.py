@@ -1,5 +1,11 @@
 from __future__ import annotations
 
+import os
+from typing import Iterable, Iterator
+
+from emunium._parsing.schema import Schema
+from emunium._parsing.stream import StreamDocument, StreamSource, iter_matches
+
 ROLE_SELECTOR_MAP = {
     "button": 'button, [role="button"], input[type="button"], input[type="submit"]',
     "link": 'a[href], [role="link"]',
@@ -23,6 +29,24 @@ class Locator:
     def __init__(self, nodes: list[object]) -> None:
         self._nodes = nodes
 
+    def locator(self, css: str, *, has_text: str | None = None) -> Locator:
+        """Query *css* inside the current nodes only, preserving document order."""
+        seen: set[int] = set()
+        result = []
+        for node in self._nodes:
+            if not hasattr(node, "css"):
+                continue
+            for child in node.css(css):
+                key = getattr(child, "mem_id", None) or id(child)
+                if key in seen:
+                    continue
+                seen.add(key)
+                result.append(child)
+        loc = Locator(result)
+        if has_text is not None:
+            loc = loc.filter(has_text=has_text)
+        return loc
+
     def filter(self, *, has_text: str | None = None) -> Locator:
         result = self._nodes
         if has_text is not None:
@@ -38,6 +62,10 @@ class Locator:
                     result.append(n)
         return Locator(result)
 
+    def extract(self, schema: dict | Schema, *, columns: bool = False) -> list | dict:
+        """Apply *schema* to every node; returns records or a column dict."""
+        return Schema.of(schema).run_many(self._nodes, columns=columns)
+
     @property
     def first(self) -> object | None:
         return self._nodes[0] if self._nodes else None
@@ -88,63 +116,104 @@ class Locator:
 class PageParser:
     """Parses a static HTML snapshot and provides Playwright-style query methods.
 
-    Uses selectolax if available, otherwise falls back to basic regex parsing.
+    Uses selectolax if available, otherwise falls back to a pure-Python
+    streaming parser (``html.parser``) that supports a CSS subset: tag, ``*``,
+    ``#id``, ``.class``, attribute and ``:not()`` selectors with
+    descendant/child combinators and selector lists. Query results are cached
+    per selector, so repeated lookups against the same snapshot do not
+    re-traverse the tree.
     """
 
     def __init__(self, html: str) -> None:
         self._html = html
         self._tree = None
+        self._cache: dict[str, list[object]] = {}
+        self._id_index: dict[str, object] | None = None
         try:
             from selectolax.lexbor import LexborHTMLParser
 
             self._tree = LexborHTMLParser(html)
         except ImportError:
             pass
+        self._doc = self._tree if self._tree is not None else StreamDocument(html)
+
+    @staticmethod
+    def iter_matches(
+        source: StreamSource,
+        css: str,
+        *,
+        chunk_size: int = 1 << 16,
+        encoding: str = "utf-8",
+    ) -> Iterator[object]:
+        """Stream matches of *css* from an HTML string, path or text file object.
+
+        Uses the pure-Python parser regardless of selectolax, so huge dumps are
+        scanned in bounded memory and matches are yielded as soon as they close.
+        """
+        return iter_matches(source, css, chunk_size=chunk_size, encoding=encoding)
+
+    def _select(self, css: str) -> list[object]:
+        nodes = self._cache.get(css)
+        if nodes is None:
+            nodes = list(self._doc.css(css))
+            self._cache[css] = nodes
+        return nodes
+
+    def _by_id(self, element_id: str) -> object | None:
+        if self._id_index is None:
+            index: dict[str, object] = {}
+            for node in self._select("[id]"):
+                index.setdefault(node.attrs.get("id") or "", node)
+            self._id_index = index
+        return self._id_index.get(element_id)
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+        self._id_index = None
 
     @property
     def title(self) -> str | None:
         if self._tree:
-            node = self._tree.css_first("title")
-            return node.text() if node else None
-        import re
-
-        m = re.search(
-            r"<title[^>]*>(.*?)</title>", self._html, re.IGNORECASE | re.DOTALL
-        )
-        return m.group(1).strip() if m else None
+            nodes = self._select("title")
+            return nodes[0].text() if nodes else None
+        node = self._doc.css_first("title")
+        return node.text().strip() if node else None
 
     def locator(self, css: str, *, has_text: str | None = None) -> Locator:
-        if self._tree:
-            nodes = list(self._tree.css(css))
-            loc = Locator(nodes)
-            if has_text is not None:
-                loc = loc.filter(has_text=has_text)
-            return loc
-        return Locator([])
+        loc = Locator(self._select(css))
+        if has_text is not None:
+            loc = loc.filter(has_text=has_text)
+        return loc
 
     @staticmethod
     def _css_escape(value: str) -> str:
         return (
             value.replace("\\", "\\\\")
             .replace('"', '\\"')
-            .replace("\n", "\\n")
-            .replace("\r", "\\r")
+            .replace("\n", "\\a ")
+            .replace("\r", "\\d ")
         )
 
     def get_by_text(self, text: str, *, exact: bool = False) -> Locator:
-        if not self._tree:
-            return Locator([])
-        safe = self._css_escape(text)
-        candidates = list(self._tree.css(f':lexbor-contains("{safe}" i)'))
+        """Innermost elements whose text, children included, contains *text*.
+
+        Matching is case-insensitive; ``exact=True`` requires the stripped
+        text to equal *text*. Both parser backends return the same elements.
+        """
+        target = text.lower()
+        candidates = [
+            n
+            for n in self._select("*")
+            if target in n.text().lower()
+            and not any(target in child.text().lower() for child in n.iter())
+        ]
         if exact:
-            candidates = [n for n in candidates if (n.text(strip=True) or "") == text]
+            candidates = [n for n in candidates if n.text().strip() == text]
         return Locator(candidates)
 
     def get_by_role(self, role: str, *, name: str | None = None) -> Locator:
-        if not self._tree:
-            return Locator([])
         selector = ROLE_SELECTOR_MAP.get(role, f'[role="{role}"]')
-        nodes = list(self._tree.css(selector))
+        nodes = self._select(selector)
         if name is not None:
             target = name.lower()
             nodes = [
@@ -158,13 +227,11 @@ class PageParser:
         return Locator(nodes)
 
     def get_by_placeholder(self, text: str, *, exact: bool = False) -> Locator:
-        if not self._tree:
-            return Locator([])
         if exact:
-            nodes = list(self._tree.css(f'[placeholder="{self._css_escape(text)}"]'))
+            nodes = self._select(f'[placeholder="{self._css_escape(text)}"]')
         else:
             target = text.lower()
-            all_inputs = self._tree.css("[placeholder]")
+            all_inputs = self._select("[placeholder]")
             nodes = [
                 n
                 for n in all_inputs
@@ -173,17 +240,15 @@ class PageParser:
         return Locator(nodes)
 
     def get_by_label(self, text: str) -> Locator:
-        if not self._tree:
-            return Locator([])
         target = text.lower()
-        labels = self._tree.css("label")
+        labels = self._select("label")
         results = []
         for label in labels:
             if target not in (label.text(strip=True) or "").lower():
                 continue
             for_attr = label.attrs.get("for")
             if for_attr:
-                el = self._tree.css_first(f"#{for_attr}")
+                el = self._by_id(for_attr)
                 if el:
                     results.append(el)
             else:
@@ -192,8 +257,40 @@ class PageParser:
                     results.append(inp)
         return Locator(results)
 
+    def extract(self, schema: dict | Schema, *, columns: bool = False) -> dict:
+        """Extract a record from the snapshot using a declarative schema.
+
+        The schema is compiled once (pass a :class:`Schema` to reuse it across
+        pages). With ``columns=True`` nested lists come back as column lists.
+        """
+        compiled = Schema.of(schema)
+        return compiled.run(self._doc, columns=columns, select=self._select)
+
+    @staticmethod
+    def extract_many(
+        sources: Iterable[str | bytes | os.PathLike[str]],
+        schema: dict | Schema,
+        *,
+        workers: int | None = None,
+        chunksize: int = 16,
+        max_pending: int | None = None,
+        encoding: str = "utf-8",
+    ) -> Iterator[dict]:
+        """Run :meth:`extract` over many pages in a process pool.
+
+        ``str``/``bytes`` items are HTML; ``pathlib.Path`` items are read by
+        the workers themselves. Results stream back in input order.
+        """
+        from emunium._parsing.bulk import extract_many
+
+        return extract_many(
+            sources,
+            Schema.of(schema),
+            workers=workers,
+            chunksize=chunksize,
+            max_pending=max_pending,
+            encoding=encoding,
+        )
+
     def get_by_test_id(self, test_id: str) -> Locator:
-        if not self._tree:
-            return Locator([])
-        nodes = list(self._tree.css(f'[data-testid="{self._css_escape(test_id)}"]'))
-        return Locator(nodes)
+        return Locator(self._select(f'[data-testid="{self._css_escape(test_id)}"]'))